@@ -0,0 +1,5 @@
+"""Benchmarks for the email verification engine
+
+python -m benchmarks writes a JSON report (see bench.py for the options);
+benchmarks.mock_providers stands in for the provider APIs.
+"""
@@ -0,0 +1,322 @@
+"""Benchmark suites for the verification engine, run against local mock providers"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from .mock_providers import MockProviderServer
+
+PROVIDERS = ('hunter', 'neverbounce', 'zerobounce')
+SUITES = ('basic', 'cache', 'providers', 'batch')
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+DEFAULT_PROVIDER_CALLS = 300
+DEFAULT_BATCH_ROWS = 20_000
+
+def synthetic_emails(count, seed=0, domain_count=500):
+    """Addresses with a realistic mix: repeats, bad formats and disposable domains"""
+    rng = random.Random(seed)
+    domains = [f"company{i}.com" for i in range(domain_count)] + ['gmail.com', 'yahoo.com', 'mailinator.com', 'yopmail.com']
+    emails = []
+    for i in range(count):
+        roll = rng.random()
+        if roll < 0.05:
+            emails.append(f"broken-address-{i}")
+        elif roll < 0.15 and emails:
+            emails.append(rng.choice(emails))
+        else:
+            emails.append(f"user{rng.randrange(count)}@{rng.choice(domains)}")
+    return emails
+
+def write_csv(path, emails):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('name,email\n')
+        for i, email in enumerate(emails):
+            f.write(f"n{i},{email}\n")
+
+def percentiles(samples):
+    """p50/p95/p99 in milliseconds"""
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+    pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+    return {'p50': round(pick(0.50), 3), 'p95': round(pick(0.95), 3), 'p99': round(pick(0.99), 3)}
+
+def timed(fn, repeat):
+    """Run fn repeat times; returns (best seconds, median seconds, last return value)"""
+    durations = []
+    value = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        value = fn()
+        durations.append(time.perf_counter() - started)
+    return min(durations), statistics.median(durations), value
+
+def record(name, ops, best, median, **extra):
+    return dict({
+        'name': name,
+        'ops': ops,
+        'seconds': round(best, 6),
+        'median_seconds': round(median, 6),
+        'ops_per_sec': round(ops / best, 1) if best else None
+    }, **extra)
+
+def fast_limiters():
+    """Token buckets that never throttle, so runs measure the engine rather than the configured limits"""
+    from email_verifier.limits import TokenBucket
+    return {provider: TokenBucket(1e9, 1e9) for provider in PROVIDERS}
+
+def bench_basic(args):
+    from email_verifier import ProEmailVerifier
+    import pandas as pd
+    
+    verifier = ProEmailVerifier()
+    results = []
+    for size in args.sizes:
+        # The default list repeats a few hundred domains; the second gives most rows their own domain
+        for domain_count in (500, max(500, size // 5)):
+            params = {'rows': size} if domain_count == 500 else {'rows': size, 'domains': domain_count}
+            emails = synthetic_emails(size, domain_count=domain_count)
+            best, median, _ = timed(lambda: [verifier.basic_verify(e) for e in emails], args.repeat)
+            results.append(record('basic_verify', size, best, median, params=params))
+            series = pd.Series(emails)
+            best, median, _ = timed(lambda: verifier.basic_verify_many(series), args.repeat)
+            results.append(record('basic_verify_many', size, best, median, params=params))
+    return results
+
+def bench_cache(args, work_dir):
+    from email_verifier import PersistentResultCache, VerificationCache
+    
+    size = min(max(args.sizes), 100_000)
+    emails = [f"user{i}@company{i % 500}.com" for i in range(size)]
+    result = {'result': 'valid', 'flags': ['has_dns_mx'], 'result_code': 0}
+    results = []
+    
+    memory = VerificationCache(max_entries=size)
+    for email in emails:
+        memory.put('neverbounce', email, result)
+    best, median, _ = timed(lambda: [memory.get('neverbounce', e) for e in emails], args.repeat)
+    results.append(record('memory_cache_hit', size, best, median, params={'entries': size}))
+    best, median, _ = timed(lambda: [memory.get('zerobounce', e) for e in emails], args.repeat)
+    results.append(record('memory_cache_miss', size, best, median, params={'entries': size}))
+    
+    store = PersistentResultCache(os.path.join(work_dir, 'bench_cache.db'))
+    best, median, _ = timed(lambda: store.put_many('neverbounce', {e: result for e in emails}), 1)
+    results.append(record('store_put_many', size, best, median, params={'entries': size}))
+    sample = emails[:min(size, 10_000)]
+    best, median, _ = timed(lambda: [store.get('neverbounce', e) for e in sample], args.repeat)
+    results.append(record('store_get_hit', len(sample), best, median, params={'entries': size}))
+    best, median, _ = timed(lambda: [store.get('zerobounce', e) for e in sample], args.repeat)
+    results.append(record('store_get_miss', len(sample), best, median, params={'entries': size}))
+    best, median, _ = timed(lambda: store.get_many('neverbounce', emails), args.repeat)
+    results.append(record('store_get_many', size, best, median, params={'entries': size}))
+    return results
+
+def bench_providers(args, server):
+    from email_verifier import CreditLedger, ProEmailVerifier, VerificationCache
+    
+    calls = args.provider_calls
+    api_keys = {provider: 'bench-key' for provider in PROVIDERS}
+    results = []
+    
+    verifier = ProEmailVerifier(cache=VerificationCache(max_entries=calls * 4), rate_limiters=fast_limiters(),
+                                ledger=CreditLedger())
+    for provider in PROVIDERS:
+        emails = [f"{provider}{i}@company{i % 50}.com" for i in range(calls)]
+        latencies = []
+        before = dict(server.stats)
+        started = time.perf_counter()
+        for email in emails:
+            call_started = time.perf_counter()
+            verifier._cached_call(provider, email, api_keys[provider])
+            latencies.append(time.perf_counter() - call_started)
+        elapsed = time.perf_counter() - started
+        retried = {k: server.stats[k] - before.get(k, 0) for k in ('429', '500')}
+        results.append(record('provider_call_miss', calls, elapsed, elapsed, params={'provider': provider},
+                              latency_ms=percentiles(latencies), server_errors=retried))
+    
+        latencies = []
+        started = time.perf_counter()
+        for email in emails:
+            call_started = time.perf_counter()
+            verifier._cached_call(provider, email, api_keys[provider])
+            latencies.append(time.perf_counter() - call_started)
+        elapsed = time.perf_counter() - started
+        results.append(record('provider_call_hit', calls, elapsed, elapsed, params={'provider': provider},
+                              latency_ms=percentiles(latencies)))
+    
+    # Fan-out: threads per address vs one event loop for the whole list
+    emails = [f"fanout{i}@company{i % 50}.com" for i in range(calls)]
+    verifier = ProEmailVerifier(cache=VerificationCache(max_entries=calls * 4), rate_limiters=fast_limiters())
+    best, median, _ = timed(lambda: [verifier.verify_all(e, api_keys) for e in emails], 1)
+    results.append(record('verify_all_sequential', calls, best, median, params={'providers': len(PROVIDERS)}))
+    
+    emails = [f"async{i}@company{i % 50}.com" for i in range(calls * 10)]
+    verifier = ProEmailVerifier(cache=VerificationCache(max_entries=calls * 40), rate_limiters=fast_limiters())
+    best, median, _ = timed(lambda: verifier.verify_many(emails, api_keys), 1)
+    results.append(record('verify_many_async', len(emails), best, median, params={'providers': len(PROVIDERS)},
+                          peak_in_flight=server.peak_in_flight))
+    return results
+
+def bench_batch(args, server, work_dir):
+    from email_verifier import CreditLedger, PersistentResultCache, ProEmailVerifier, VerificationCache
+    from email_verifier.bulk import run_bulk_verification
+    from email_verifier.bulk_jobs import BULK_JOB_THRESHOLD
+    from email_verifier.sharded import run_sharded_basic
+    
+    rows = args.batch_rows
+    input_path = os.path.join(work_dir, 'batch_input.csv')
+    write_csv(input_path, synthetic_emails(rows, seed=1))
+    api_keys = {provider: 'bench-key' for provider in PROVIDERS}
+    results = []
+    
+    verifier = ProEmailVerifier(cache=VerificationCache(), rate_limiters=fast_limiters(),
+                                store=PersistentResultCache(os.path.join(work_dir, 'batch_cache.db')),
+                                ledger=CreditLedger())
+    # The first run fills the result caches; the later ones measure the cached path
+    for label, output_format in (('cold', 'csv'), ('warm', 'csv'), ('warm', 'parquet')):
+        requests_before = server.stats['200']
+        started = time.perf_counter()
+        summary = run_bulk_verification(
+            verifier, input_path, os.path.join(work_dir, f"batch_{label}.{output_format}"),
+            api_keys=api_keys, output_format=output_format, bulk_job_threshold=None
+        )
+        elapsed = time.perf_counter() - started
+        results.append(record('bulk_end_to_end', rows, elapsed, elapsed,
+                              params={'cache': label, 'format': output_format},
+                              provider_requests=server.stats['200'] - requests_before,
+                              provider_checked=summary['provider_checked']))
+    
+    # Same list through the NeverBounce/ZeroBounce job endpoints, with empty caches
+    verifier = ProEmailVerifier(cache=VerificationCache(), rate_limiters=fast_limiters(),
+                                store=PersistentResultCache(os.path.join(work_dir, 'batch_jobs_cache.db')),
+                                ledger=CreditLedger())
+    requests_before = server.stats['200']
+    jobs_before = server.stats['jobs']
+    started = time.perf_counter()
+    summary = run_bulk_verification(
+        verifier, input_path, os.path.join(work_dir, 'batch_jobs.csv'),
+        api_keys=api_keys, bulk_job_threshold=BULK_JOB_THRESHOLD
+    )
+    elapsed = time.perf_counter() - started
+    results.append(record('bulk_end_to_end', rows, elapsed, elapsed,
+                          params={'cache': 'cold', 'format': 'csv', 'jobs': 'bulk'},
+                          provider_requests=server.stats['200'] - requests_before,
+                          provider_checked=summary['provider_checked'],
+                          bulk_jobs=server.stats['jobs'] - jobs_before))
+    
+    best, median, _ = timed(lambda: run_sharded_basic(
+        input_path, os.path.join(work_dir, 'sharded.csv'),
+        work_dir=os.path.join(work_dir, f"shards-{time.monotonic_ns()}")
+    ), 1)
+    results.append(record('sharded_basic', rows, best, median, params={'workers': os.cpu_count()}))
+    return results
+
+def environment():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)), timeout=10).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ''
+    versions = {}
+    for module in ('pandas', 'pyarrow', 'aiohttp', 'requests'):
+        try:
+            versions[module] = __import__(module).__version__
+        except ImportError:
+            versions[module] = None
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'packages': versions
+    }
+
+def result_key(result):
+    return result['name'] + json.dumps(result.get('params', {}), sort_keys=True)
+
+def compare(baseline, results):
+    """Lines describing each benchmark's change in throughput against a baseline run"""
+    previous = {result_key(r): r for r in baseline['results']}
+    lines = []
+    for result in results:
+        old = previous.get(result_key(result))
+        if not old or not old.get('ops_per_sec') or not result.get('ops_per_sec'):
+            continue
+        change = result['ops_per_sec'] / old['ops_per_sec'] - 1
+        params = ' '.join(f"{k}={v}" for k, v in result.get('params', {}).items())
+        lines.append(f"{result['name']:<24} {params:<32} {old['ops_per_sec']:>14,.0f} -> "
+                     f"{result['ops_per_sec']:>14,.0f} ops/s  {change:+.1%}")
+    return lines
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m benchmarks',
+                                     description='Benchmark the verification engine against local mock providers.')
+    parser.add_argument('--suites', default=','.join(SUITES), help=f"Comma list of: {', '.join(SUITES)}")
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)), help='Row counts for the basic suite')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per in-process benchmark (best is reported)')
+    parser.add_argument('--provider-calls', type=int, default=DEFAULT_PROVIDER_CALLS)
+    parser.add_argument('--batch-rows', type=int, default=DEFAULT_BATCH_ROWS)
+    parser.add_argument('--latency', type=float, default=0.02, help='Mock provider latency in seconds')
+    parser.add_argument('--jitter', type=float, default=0.005)
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Share of mock responses that are HTTP 500')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='Share of mock responses that are HTTP 429')
+    parser.add_argument('--output', default='-', help='JSON results file (default: stdout)')
+    parser.add_argument('--compare', help='Earlier results file to compare throughput against')
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    suites = [s.strip() for s in args.suites.split(',') if s.strip()]
+    unknown = sorted(set(suites) - set(SUITES))
+    if unknown:
+        build_parser().error(f"unknown suite(s): {', '.join(unknown)}")
+    args.sizes = [int(size) for size in args.sizes.split(',')]
+    
+    server = MockProviderServer(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                                throttle_rate=args.throttle_rate, seed=0)
+    base_url = server.start()
+    # Both the sync and async transports read this mapping when they are built; the
+    # mock also serves the bulk job hosts
+    from email_verifier.transport import PROVIDER_BASE_URLS
+    PROVIDER_BASE_URLS.update({name: base_url for name in PROVIDER_BASE_URLS})
+    
+    results = []
+    with tempfile.TemporaryDirectory(prefix='email-verifier-bench-') as work_dir:
+        for suite in suites:
+            print(f"Running {suite}...", file=sys.stderr, flush=True)
+            if suite == 'basic':
+                results += bench_basic(args)
+            elif suite == 'cache':
+                results += bench_cache(args, work_dir)
+            elif suite == 'providers':
+                results += bench_providers(args, server)
+            elif suite == 'batch':
+                results += bench_batch(args, server, work_dir)
+    server.stop()
+    
+    report = {
+        'environment': environment(),
+        'config': {k: v for k, v in vars(args).items() if k not in ('output', 'compare')},
+        'mock_server': dict(server.stats, peak_in_flight=server.peak_in_flight),
+        'results': results
+    }
+    text = json.dumps(report, indent=2)
+    if args.output == '-':
+        print(text)
+    else:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            for line in compare(json.load(f), results):
+                print(line, file=sys.stderr)
+    return 0
@@ -0,0 +1,288 @@
+"""Local mock of the Hunter.io, NeverBounce and ZeroBounce HTTP APIs
+
+Serves the single-check, account and bulk job endpoints the verifier uses,
+with configurable latency, server errors and 429 throttling. Bulk jobs finish
+as soon as they are created. Point the app at it
+with HUNTER_API_URL / NEVERBOUNCE_API_URL / ZEROBOUNCE_API_URL /
+ZEROBOUNCE_BULK_API_URL, or run it standalone:
+
+    python -m benchmarks.mock_providers --port 8099 --latency 0.2 --throttle-rate 0.05
+"""
+import argparse
+import asyncio
+import csv
+import hashlib
+import itertools
+import json
+import random
+import threading
+import time
+from collections import Counter
+from email import message_from_bytes
+from io import StringIO
+from urllib.parse import parse_qs, urlsplit
+
+# Share of addresses per outcome; the outcome is fixed per address so repeated runs agree
+OUTCOME_WEIGHTS = (('valid', 0.70), ('invalid', 0.15), ('catch_all', 0.10), ('unknown', 0.05))
+
+def outcome_for(email):
+    """Deterministic outcome for an address, spread by OUTCOME_WEIGHTS"""
+    point = int(hashlib.md5(email.lower().encode()).hexdigest()[:8], 16) / 0xFFFFFFFF
+    for outcome, weight in OUTCOME_WEIGHTS:
+        point -= weight
+        if point <= 0:
+            return outcome
+    return OUTCOME_WEIGHTS[-1][0]
+
+def hunter_body(email):
+    result, score = {'valid': ('deliverable', 92), 'invalid': ('undeliverable', 8),
+                     'catch_all': ('risky', 60), 'unknown': ('risky', 45)}[outcome_for(email)]
+    return {'data': {'result': result, 'score': score, 'sources': 2, 'regexp': True, 'mx_records': True,
+                     'smtp_server': True, 'smtp_check': result == 'deliverable',
+                     'accept_all': outcome_for(email) == 'catch_all'}}
+
+def neverbounce_body(email):
+    result = {'valid': 'valid', 'invalid': 'invalid', 'catch_all': 'catchall', 'unknown': 'unknown'}[outcome_for(email)]
+    return {'status': 'success', 'result': result, 'flags': ['has_dns', 'has_dns_mx'],
+            'suggested_correction': '', 'execution_time': 120}
+
+def zerobounce_body(email):
+    status = {'valid': 'valid', 'invalid': 'invalid', 'catch_all': 'catch-all', 'unknown': 'unknown'}[outcome_for(email)]
+    account, _, domain = email.partition('@')
+    return {'address': email, 'status': status, 'sub_status': '', 'account': account, 'domain': domain,
+            'mx_found': 'true', 'smtp_provider': 'mock', 'processed_at': time.strftime('%Y-%m-%d %H:%M:%S')}
+
+ROUTES = {
+    '/v2/email-verifier': lambda q: hunter_body(q.get('email', '')),
+    '/v2/account': lambda q: {'data': {'requests': {'verifications': {'available': 100000, 'used': 0}}}},
+    '/v4/single/check': lambda q: neverbounce_body(q.get('email', '')),
+    '/v4/account/info': lambda q: {'status': 'success', 'credits_info': {'free_credits_remaining': 0,
+                                                                         'paid_credits_remaining': 100000}},
+    '/v2/validate': lambda q: zerobounce_body(q.get('email', '')),
+    '/v2/getcredits': lambda q: {'Credits': '100000'}
+}
+
+# Bulk job endpoints, answered by the server method of the same name since jobs keep state
+JOB_ROUTES = {
+    '/v4/jobs/create': '_neverbounce_create',
+    '/v4/jobs/status': '_neverbounce_status',
+    '/v4/jobs/results': '_neverbounce_results',
+    '/v2/sendfile': '_zerobounce_sendfile',
+    '/v2/filestatus': '_zerobounce_filestatus',
+    '/v2/getfile': '_zerobounce_getfile'
+}
+
+def multipart_file(body, content_type):
+    """Text of the first uploaded file in a multipart/form-data body"""
+    message = message_from_bytes(f"Content-Type: {content_type}\r\n\r\n".encode() + body)
+    for part in message.walk():
+        if part.get_filename():
+            return part.get_payload(decode=True).decode('utf-8')
+    return ''
+
+# HTTP/1.1 keep-alive server on its own event loop thread
+class MockProviderServer:
+    def __init__(self, host='127.0.0.1', port=0, latency=0.05, jitter=0.0, error_rate=0.0,
+                 throttle_rate=0.0, retry_after=0, seed=None):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+        self.stats = Counter()
+        self.peak_in_flight = 0
+        self._in_flight = 0
+        self._loop = None
+        self._server = None
+        self._thread = None
+        self._handlers = {}
+        self._jobs = {}
+        self._job_ids = itertools.count(1)
+    
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+    
+    def _neverbounce_create(self, query, body, content_type):
+        emails = [item.get('email', '') for item in json.loads(body or b'{}').get('input', [])]
+        job_id = next(self._job_ids)
+        self._jobs[str(job_id)] = emails
+        self.stats['jobs'] += 1
+        return {'status': 'success', 'job_id': job_id}
+    
+    def _neverbounce_status(self, query, body, content_type):
+        if query.get('job_id') not in self._jobs:
+            return {'status': 'general_failure', 'message': 'Job not found'}
+        return {'status': 'success', 'job_status': 'complete', 'percent_complete': 100}
+    
+    def _neverbounce_results(self, query, body, content_type):
+        emails = self._jobs.get(query.get('job_id'))
+        if emails is None:
+            return {'status': 'general_failure', 'message': 'Job not found'}
+        page = int(query.get('page', 1))
+        page_size = int(query.get('items_per_page', 1000))
+        results = [{'data': {'email': e}, 'verification': neverbounce_body(e)}
+                   for e in emails[(page - 1) * page_size:page * page_size]]
+        return {'status': 'success', 'total_pages': max(1, -(-len(emails) // page_size)), 'page': page,
+                'results': results}
+    
+    def _zerobounce_sendfile(self, query, body, content_type):
+        rows = list(csv.reader(StringIO(multipart_file(body, content_type))))
+        file_id = f"mock-{next(self._job_ids)}"
+        self._jobs[file_id] = [row[0] for row in rows[1:] if row]
+        self.stats['jobs'] += 1
+        return {'success': True, 'message': 'File Accepted', 'file_id': file_id}
+    
+    def _zerobounce_filestatus(self, query, body, content_type):
+        if query.get('file_id') not in self._jobs:
+            return {'success': False, 'message': 'File not found'}
+        return {'success': True, 'file_status': 'Complete', 'complete_percentage': '100%'}
+    
+    def _zerobounce_getfile(self, query, body, content_type):
+        emails = self._jobs.get(query.get('file_id'))
+        if emails is None:
+            return {'success': False, 'message': 'File not found'}
+        out = StringIO()
+        writer = csv.writer(out)
+        writer.writerow(['email', 'ZB Status', 'ZB Sub Status', 'ZB MX Found'])
+        for e in emails:
+            result = zerobounce_body(e)
+            writer.writerow([e, result['status'], result['sub_status'], result['mx_found']])
+        return out.getvalue()
+    
+    def _respond(self, target, body=b'', content_type=''):
+        """Return (status line, headers, body) for one request; text bodies are sent as CSV"""
+        parts = urlsplit(target)
+        query = {k: v[0] for k, v in parse_qs(parts.query).items()}
+        roll = self.random.random()
+        if roll < self.throttle_rate:
+            self.stats['429'] += 1
+            return '429 Too Many Requests', {'Retry-After': str(self.retry_after)}, {'error': 'rate limited'}
+        if roll < self.throttle_rate + self.error_rate:
+            self.stats['500'] += 1
+            return '500 Internal Server Error', {}, {'error': 'mock failure'}
+        if parts.path in JOB_ROUTES:
+            self.stats['200'] += 1
+            return '200 OK', {}, getattr(self, JOB_ROUTES[parts.path])(query, body, content_type)
+        route = ROUTES.get(parts.path)
+        if route is None:
+            self.stats['404'] += 1
+            return '404 Not Found', {}, {'error': 'not found'}
+        self.stats['200'] += 1
+        return '200 OK', {}, route(query)
+    
+    async def _handle(self, reader, writer):
+        self._handlers[asyncio.current_task()] = writer
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                length = 0
+                content_type = ''
+                while True:
+                    header = await reader.readline()
+                    if header in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = header.decode('latin-1').partition(':')
+                    if name.strip().lower() == 'content-length':
+                        length = int(value)
+                    elif name.strip().lower() == 'content-type':
+                        content_type = value.strip()
+                body = await reader.readexactly(length) if length else b''
+    
+                self._in_flight += 1
+                self.peak_in_flight = max(self.peak_in_flight, self._in_flight)
+                delay = self.latency + self.random.uniform(-self.jitter, self.jitter)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                self._in_flight -= 1
+    
+                status, headers, payload = self._respond(request_line.split()[1].decode('latin-1'), body, content_type)
+                if isinstance(payload, str):
+                    data, media_type = payload.encode(), 'text/csv'
+                else:
+                    data, media_type = json.dumps(payload).encode(), 'application/json'
+                head = [f"HTTP/1.1 {status}", f"Content-Type: {media_type}", f"Content-Length: {len(data)}"]
+                head += [f"{name}: {value}" for name, value in headers.items()]
+                writer.write(('\r\n'.join(head) + '\r\n\r\n').encode() + data)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except asyncio.CancelledError:
+            # Cancelled by _shutdown; ending quietly keeps asyncio's stream callback from logging it
+            pass
+        finally:
+            self._handlers.pop(asyncio.current_task(), None)
+            writer.close()
+    
+    async def _shutdown(self):
+        # Idle keep-alive connections would otherwise leave handler tasks pending when the loop stops
+        self._server.close()
+        handlers = list(self._handlers.items())
+        for task, writer in handlers:
+            writer.close()
+            task.cancel()
+        await asyncio.gather(*(task for task, _ in handlers), return_exceptions=True)
+        await self._server.wait_closed()
+    
+    def start(self):
+        """Start serving on a background thread and return the base URL"""
+        ready = threading.Event()
+    
+        def serve():
+            self._loop = asyncio.new_event_loop()
+            self._server = self._loop.run_until_complete(
+                asyncio.start_server(self._handle, self.host, self.port, backlog=4096)
+            )
+            self.port = self._server.sockets[0].getsockname()[1]
+            ready.set()
+            self._loop.run_forever()
+            self._loop.close()
+    
+        self._thread = threading.Thread(target=serve, daemon=True)
+        self._thread.start()
+        ready.wait()
+        return self.url
+    
+    def stop(self):
+        if self._loop is not None:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result(timeout=5)
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+            self._loop = None
+    
+    def __enter__(self):
+        self.start()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.stop()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.mock_providers', description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8099)
+    parser.add_argument('--latency', type=float, default=0.05, help='Seconds per response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Uniform +/- seconds added to the latency')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Share of requests answered with HTTP 500')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='Share of requests answered with HTTP 429')
+    parser.add_argument('--retry-after', type=int, default=0, help='Retry-After seconds sent with 429s')
+    args = parser.parse_args(argv)
+    
+    server = MockProviderServer(args.host, args.port, args.latency, args.jitter, args.error_rate,
+                                args.throttle_rate, args.retry_after)
+    print(f"Mock providers listening on {server.start()}", flush=True)
+    try:
+        while True:
+            time.sleep(60)
+            print(json.dumps(dict(server.stats, peak_in_flight=server.peak_in_flight)), flush=True)
+    except KeyboardInterrupt:
+        server.stop()
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
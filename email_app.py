@@ -1,11 +1,25 @@
 import streamlit as st
-import re
 import pandas as pd
 from datetime import datetime
-from io import StringIO
 import time
-import requests
-import json
+
+from email_verifier import (
+    CreditLedger,
+    KeyHealthMonitor,
+    PersistentResultCache,
+    ProEmailVerifier,
+    VerificationCache,
+    build_rate_limiters
+)
+from email_verifier.bulk_jobs import BULK_JOB_THRESHOLD
+from email_verifier.dns_check import MXResolver, SMTPProber
+from email_verifier.jobs import JobJournal, new_job_id, run_job
+from email_verifier.metrics import METRICS, METRICS_PORT, RerunTimer, start_metrics_server
+from email_verifier.scoring import CONSENSUS_THRESHOLD, score_results
+from email_verifier.transport import build_transports
+
+# Phase timings for this rerun, shown in the sidebar diagnostics panel
+rerun_timer = RerunTimer()
 
 # Page setup
 st.set_page_config(
@@ -58,170 +72,46 @@ if 'api_keys' not in st.session_state:
         'zerobounce': ''
     }
 
-# Professional verification services class
-class ProEmailVerifier:
-    def __init__(self):
-        self.disposable_domains = self._load_disposable_domains()
-        self.api_status = {
-            'hunter': False,
-            'neverbounce': False,
-            'zerobounce': False
-        }
-    
-    def _load_disposable_domains(self):
-        """Extended list of disposable domains"""
-        return {
-            'tempmail.com', 'mailinator.com', '10minutemail.com',
-            'throwawaymail.com', 'yopmail.com', 'guerrillamail.com',
-            'temp-mail.org', 'fakeinbox.com', 'dispostable.com',
-            'getairmail.com', 'maildrop.cc', 'tempail.com',
-            'sharklasers.com', 'guerrillamail.net', 'yopmail.net',
-            'mailinator.net', 'trashmail.com', 'mailcatch.com'
-        }
-    
-    # Basic verification (always works)
-    def basic_verify(self, email):
-        """Basic email verification"""
-        result = {
-            'email': email,
-            'basic_format': False,
-            'basic_disposable': False,
-            'basic_status': 'Unknown',
-            'professional_checks': {}
-        }
-        
-        # Format check
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(pattern, email):
-            result['basic_status'] = 'Invalid Format'
-            return result
-        
-        result['basic_format'] = True
-        
-        # Domain check
-        domain = email.split('@')[1].lower()
-        
-        # Disposable check
-        if domain in self.disposable_domains:
-            result['basic_disposable'] = True
-            result['basic_status'] = 'Disposable Email'
-            return result
-        
-        result['basic_status'] = 'Valid (Basic Check)'
-        return result
-    
-    # Hunter.io API verification
-    def hunter_verify(self, email, api_key):
-        """Verify email using Hunter.io API"""
-        if not api_key:
-            return {'error': 'API key not configured'}
-        
-        try:
-            url = f"https://api.hunter.io/v2/email-verifier"
-            params = {
-                'email': email,
-                'api_key': api_key
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
-            data = response.json()
-            
-            if response.status_code == 200:
-                result = data.get('data', {})
-                return {
-                    'score': result.get('score', 0),
-                    'status': result.get('result', 'unknown'),
-                    'sources': result.get('sources', 0),
-                    'regexp': result.get('regexp', False),
-                    'gibberish': result.get('gibberish', False),
-                    'disposable': result.get('disposable', False),
-                    'webmail': result.get('webmail', False),
-                    'mx_records': result.get('mx_records', False),
-                    'smtp_server': result.get('smtp_server', False),
-                    'smtp_check': result.get('smtp_check', False),
-                    'accept_all': result.get('accept_all', False),
-                    'block': result.get('block', False)
-                }
-            else:
-                return {'error': data.get('errors', [{}])[0].get('details', 'API error')}
-                
-        except Exception as e:
-            return {'error': str(e)}
-    
-    # NeverBounce API verification
-    def neverbounce_verify(self, email, api_key):
-        """Verify email using NeverBounce API"""
-        if not api_key:
-            return {'error': 'API key not configured'}
-        
-        try:
-            url = "https://api.neverbounce.com/v4/single/check"
-            params = {
-                'key': api_key,
-                'email': email
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
-            data = response.json()
-            
-            if response.status_code == 200:
-                return {
-                    'result': data.get('result', 'unknown'),
-                    'result_code': data.get('result_code', ''),
-                    'flags': data.get('flags', []),
-                    'suggested_correction': data.get('suggested_correction', ''),
-                    'credits_info': data.get('credits_info', {})
-                }
-            else:
-                return {'error': data.get('message', 'API error')}
-                
-        except Exception as e:
-            return {'error': str(e)}
-    
-    # ZeroBounce API verification
-    def zerobounce_verify(self, email, api_key):
-        """Verify email using ZeroBounce API"""
-        if not api_key:
-            return {'error': 'API key not configured'}
-        
-        try:
-            url = "https://api.zerobounce.net/v2/validate"
-            params = {
-                'api_key': api_key,
-                'email': email
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
-            data = response.json()
-            
-            if response.status_code == 200:
-                return {
-                    'status': data.get('status', 'unknown'),
-                    'sub_status': data.get('sub_status', ''),
-                    'account': data.get('account', ''),
-                    'domain': data.get('domain', ''),
-                    'did_you_mean': data.get('did_you_mean', ''),
-                    'domain_age_days': data.get('domain_age_days', ''),
-                    'smtp_provider': data.get('smtp_provider', ''),
-                    'mx_found': data.get('mx_found', ''),
-                    'mx_record': data.get('mx_record', ''),
-                    'firstname': data.get('firstname', ''),
-                    'lastname': data.get('lastname', ''),
-                    'gender': data.get('gender', ''),
-                    'country': data.get('country', ''),
-                    'region': data.get('region', ''),
-                    'city': data.get('city', ''),
-                    'zipcode': data.get('zipcode', ''),
-                    'processed_at': data.get('processed_at', '')
-                }
-            else:
-                return {'error': data.get('error', 'API error')}
-                
-        except Exception as e:
-            return {'error': str(e)}
+# Shared engine: built once per process and reused by every session and rerun
+@st.cache_resource
+def get_verifier():
+    """Verifier with its caches, HTTP sessions, rate limiters and credit ledger"""
+    return ProEmailVerifier(
+        cache=VerificationCache(),
+        store=PersistentResultCache(),
+        transports=build_transports(),
+        rate_limiters=build_rate_limiters(),
+        ledger=CreditLedger()
+    )
+
+@st.cache_resource
+def get_mx_resolver():
+    """MX resolver whose DNS cache is shared across sessions"""
+    return MXResolver()
+
+@st.cache_resource
+def get_job_journal():
+    """Journal of resumable bulk jobs, shared across sessions"""
+    return JobJournal()
+
+@st.cache_resource
+def get_metrics_server():
+    """Prometheus text endpoint at :EMAIL_VERIFIER_METRICS_PORT/metrics, if that is set"""
+    return start_metrics_server(METRICS_PORT) if METRICS_PORT else None
 
 # Initialize verifier
-verifier = ProEmailVerifier()
+setup_started = time.perf_counter()
+verifier = get_verifier()
+mx_resolver = get_mx_resolver()
+job_journal = get_job_journal()
+get_metrics_server()
+# Blocklist files are only re-read when they change on disk
+verifier.disposable_domains.reload()
+setup_ms = (time.perf_counter() - setup_started) * 1000
+rerun_timer.lap('engine_setup')
+
+if 'key_health' not in st.session_state:
+    st.session_state.key_health = KeyHealthMonitor(verifier.check_api_key)
 
 # Sidebar for API configuration
 with st.sidebar:
@@ -257,6 +147,10 @@ with st.sidebar:
             'neverbounce': neverbounce_key,
             'zerobounce': zerobounce_key
         }
+        # Keys are probed once on save; later reruns read the cached status
+        for provider, api_key in st.session_state.api_keys.items():
+            if api_key:
+                st.session_state.key_health.check(provider, api_key)
         st.success("API keys saved! (stored locally)")
     
     st.markdown("---")
@@ -264,19 +158,25 @@ with st.sidebar:
     # API Status Check
     st.subheader("API Status")
     
-    if hunter_key:
-        test_result = verifier.hunter_verify("test@example.com", hunter_key)
-        if 'error' not in test_result:
-            st.markdown('<div class="api-status api-active">✅ Hunter.io: Active</div>', unsafe_allow_html=True)
+    for provider, label, api_key in [
+        ('hunter', 'Hunter.io', hunter_key),
+        ('neverbounce', 'NeverBounce', neverbounce_key),
+        ('zerobounce', 'ZeroBounce', zerobounce_key)
+    ]:
+        if not api_key:
+            continue
+        key_status = st.session_state.key_health.status(provider, api_key)
+        if key_status is None:
+            st.markdown(f'<div class="api-status">⏳ {label}: Checking...</div>', unsafe_allow_html=True)
+        elif key_status['active']:
+            credits = verifier.ledger.remaining(provider, api_key)
+            credits_text = f" ({credits:,} credits)" if credits is not None else ""
+            st.markdown(f'<div class="api-status api-active">✅ {label}: Active{credits_text}</div>', unsafe_allow_html=True)
         else:
-            st.markdown(f'<div class="api-status api-inactive">❌ Hunter.io: {test_result["error"]}</div>', unsafe_allow_html=True)
+            st.markdown(f'<div class="api-status api-inactive">❌ {label}: {key_status["error"]}</div>', unsafe_allow_html=True)
     
-    if neverbounce_key:
-        test_result = verifier.neverbounce_verify("test@example.com", neverbounce_key)
-        if 'error' not in test_result:
-            st.markdown('<div class="api-status api-active">✅ NeverBounce: Active</div>', unsafe_allow_html=True)
-        else:
-            st.markdown(f'<div class="api-status api-inactive">❌ NeverBounce: {test_result["error"]}</div>', unsafe_allow_html=True)
+    st.caption(f"⚙️ Engine setup this run: {setup_ms:.1f} ms")
+rerun_timer.lap('sidebar')
 
 # Main app
 st.title("📧 Professional Email Verifier")
@@ -296,12 +196,39 @@ with col2:
     run_pro = st.button("🚀 Professional Check", type="primary", use_container_width=True)
 with col3:
     run_all = st.button("⭐ All Checks", use_container_width=True)
+rerun_timer.lap('inputs')
 
 if email:
     if run_basic or run_pro or run_all:
         # Basic check (always runs)
         basic_result = verifier.basic_verify(email)
         
+        # Professional lookups run once; every tab renders these results. "All Checks"
+        # asks every provider at once, the others go cheapest first and stop once settled
+        provider_results = {}
+        if (run_pro or run_all) and any(st.session_state.api_keys.values()):
+            provider_labels = {'hunter': 'Hunter.io', 'neverbounce': 'NeverBounce', 'zerobounce': 'ZeroBounce'}
+            if run_all:
+                provider_calls = verifier.iter_verify_all(email, st.session_state.api_keys)
+            else:
+                provider_calls = verifier.iter_verify_consensus(email, st.session_state.api_keys, basic_result)
+            with st.status("Contacting verification providers...", expanded=True) as provider_status:
+                for provider, result in provider_calls:
+                    provider_results[provider] = result
+                    if 'error' in result:
+                        st.write(f"❌ {provider_labels[provider]}: {result['error']}")
+                    else:
+                        st.write(f"✅ {provider_labels[provider]}: done")
+                for provider, key in st.session_state.api_keys.items():
+                    if key and provider not in provider_results:
+                        st.write(f"⏭️ {provider_labels[provider]}: skipped, verdict already settled")
+                provider_status.update(label="Provider checks complete", state="complete", expanded=False)
+        rerun_timer.lap('provider_checks')
+        consensus = score_results(basic_result, provider_results)
+        hunter_result = provider_results.get('hunter')
+        nb_result = provider_results.get('neverbounce')
+        zb_result = provider_results.get('zerobounce')
+        
         # Create tabs for results
         result_tabs = st.tabs(["📊 Summary", "🔍 Basic Details", "⚡ Professional APIs", "📈 Comparison"])
         
@@ -312,23 +239,23 @@ if email:
             col1, col2, col3, col4 = st.columns(4)
             
             with col1:
-                st.metric(
-                    "Basic Status",
-                    "✅ Valid" if basic_result['basic_status'] == 'Valid (Basic Check)' else "❌ Invalid"
-                )
+                if basic_result['basic_suggestion']:
+                    st.metric("Basic Status", "✏️ Typo?")
+                elif basic_result['basic_status'] == 'Valid (Basic Check)':
+                    st.metric("Basic Status", "✅ Valid")
+                else:
+                    st.metric("Basic Status", "❌ Invalid")
             
             # Professional checks if requested
             if run_pro or run_all:
                 # Hunter.io check
-                if st.session_state.api_keys['hunter']:
-                    hunter_result = verifier.hunter_verify(email, st.session_state.api_keys['hunter'])
+                if hunter_result is not None:
                     with col2:
                         if 'score' in hunter_result:
                             st.metric("Hunter.io Score", f"{hunter_result['score']}/100")
                 
                 # NeverBounce check
-                if st.session_state.api_keys['neverbounce']:
-                    nb_result = verifier.neverbounce_verify(email, st.session_state.api_keys['neverbounce'])
+                if nb_result is not None:
                     with col3:
                         if 'result' in nb_result:
                             status_map = {
@@ -341,23 +268,36 @@ if email:
                             st.metric("NeverBounce", status_map.get(nb_result['result'], '❓'))
             
             with col4:
-                # Overall recommendation
-                if basic_result['basic_status'] == 'Valid (Basic Check)':
-                    st.metric("Recommendation", "👍 Use", delta="Good")
+                # Overall recommendation from every signal gathered above
+                confidence = f"{consensus['confidence']:.0%} confidence"
+                if consensus['verdict'] == 'use':
+                    st.metric("Recommendation", "👍 Use", delta=confidence)
+                elif consensus['verdict'] == 'risky':
+                    st.metric("Recommendation", "⚠️ Risky", delta=confidence, delta_color="off")
                 else:
-                    st.metric("Recommendation", "👎 Avoid", delta="Poor", delta_color="inverse")
+                    st.metric("Recommendation", "👎 Avoid", delta=confidence, delta_color="inverse")
             
             # Overall verdict
             st.markdown("---")
-            if basic_result['basic_status'] == 'Valid (Basic Check)':
-                st.success("### ✅ This email appears to be valid")
-                st.info("**Recommendation:** Safe to use for newsletters, signups, and communications")
-            elif basic_result['basic_status'] == 'Disposable Email':
+            if basic_result['basic_status'] == 'Disposable Email':
                 st.error("### ⚠️ Temporary/Disposable Email Detected")
                 st.warning("**Recommendation:** Not suitable for important communications. User may not receive messages.")
-            else:
+            elif not basic_result['basic_format']:
                 st.error("### ❌ Invalid Email Format")
                 st.warning("**Recommendation:** Do not use. Check for typos or request a valid email.")
+            elif basic_result['basic_suggestion'] and consensus['verdict'] != 'use':
+                st.warning(f"### ✏️ Did you mean {basic_result['basic_suggestion']}?")
+                st.info("**Recommendation:** The domain looks like a typo of a popular provider. Confirm the address before using it.")
+            elif consensus['verdict'] == 'use':
+                st.success("### ✅ This email appears to be valid")
+                st.info("**Recommendation:** Safe to use for newsletters, signups, and communications")
+            elif consensus['verdict'] == 'risky':
+                st.warning("### ⚠️ Deliverability could not be confirmed")
+                st.info("**Recommendation:** Usable for low-stakes mail; confirm the address before relying on it.")
+            else:
+                st.error("### ❌ This email is unlikely to receive mail")
+                st.warning("**Recommendation:** Do not use. Ask for another address.")
+            st.caption("Based on: " + "; ".join(consensus['reasons']))
         
         with result_tabs[1]:
             st.subheader("Basic Verification Details")
@@ -367,14 +307,16 @@ if email:
                 "Format Valid": basic_result['basic_format'],
                 "Disposable Domain": basic_result['basic_disposable'],
                 "Status": basic_result['basic_status'],
+                "Suggested Correction": basic_result['basic_suggestion'] or None,
                 "Domain": email.split('@')[1] if '@' in email else 'N/A'
             })
             
             # Format explanation
             st.markdown("#### What Basic Check Includes:")
-            st.markdown("""
+            st.markdown(f"""
             - **Format Validation**: Checks if email follows standard pattern
-            - **Disposable Detection**: Compares against 500+ known temporary email services
+            - **Disposable Detection**: Compares against {len(verifier.disposable_domains):,} known temporary email services, including their subdomains
+            - **Typo Suggestions**: Flags near misses of {len(verifier.domain_suggester)} popular mail domains (gmial.com → gmail.com) without any API call
             - **Domain Parsing**: Extracts and analyzes the domain part
             - **Syntax Check**: Validates characters and structure
             """)
@@ -394,9 +336,8 @@ if email:
                 """)
             else:
                 # Hunter.io Results
-                if st.session_state.api_keys['hunter']:
+                if hunter_result is not None:
                     with st.expander("### Hunter.io Results", expanded=True):
-                        hunter_result = verifier.hunter_verify(email, st.session_state.api_keys['hunter'])
                         if 'error' in hunter_result:
                             st.error(f"Error: {hunter_result['error']}")
                         else:
@@ -419,9 +360,8 @@ if email:
                                 st.write(f"🚫 Blocked: {'✅ Yes' if hunter_result.get('block') else '❌ No'}")
                 
                 # NeverBounce Results
-                if st.session_state.api_keys['neverbounce']:
+                if nb_result is not None:
                     with st.expander("### NeverBounce Results", expanded=True):
-                        nb_result = verifier.neverbounce_verify(email, st.session_state.api_keys['neverbounce'])
                         if 'error' in nb_result:
                             st.error(f"Error: {nb_result['error']}")
                         else:
@@ -447,6 +387,23 @@ if email:
                             
                             if nb_result.get('suggested_correction'):
                                 st.info(f"**Suggested Correction:** {nb_result['suggested_correction']}")
+                
+                # ZeroBounce Results
+                if zb_result is not None:
+                    with st.expander("### ZeroBounce Results", expanded=True):
+                        if 'error' in zb_result:
+                            st.error(f"Error: {zb_result['error']}")
+                        else:
+                            col1, col2 = st.columns(2)
+                            with col1:
+                                st.metric("Status", zb_result.get('status', 'unknown').capitalize())
+                                st.metric("Sub-status", zb_result.get('sub_status') or 'None')
+                            with col2:
+                                st.metric("MX Found", "✅ Yes" if str(zb_result.get('mx_found')).lower() == 'true' else "❌ No")
+                                st.metric("SMTP Provider", zb_result.get('smtp_provider') or 'Unknown')
+                            
+                            if zb_result.get('did_you_mean'):
+                                st.info(f"**Did you mean:** {zb_result['did_you_mean']}")
         
         with result_tabs[3]:
             st.subheader("Service Comparison")
@@ -464,8 +421,7 @@ if email:
             })
             
             # Hunter.io
-            if st.session_state.api_keys['hunter']:
-                hunter_result = verifier.hunter_verify(email, st.session_state.api_keys['hunter'])
+            if hunter_result is not None:
                 if 'score' in hunter_result:
                     comparison_data.append({
                         "Service": "Hunter.io",
@@ -477,8 +433,7 @@ if email:
                     })
             
             # NeverBounce
-            if st.session_state.api_keys['neverbounce']:
-                nb_result = verifier.neverbounce_verify(email, st.session_state.api_keys['neverbounce'])
+            if nb_result is not None:
                 if 'result' in nb_result:
                     comparison_data.append({
                         "Service": "NeverBounce",
@@ -489,6 +444,18 @@ if email:
                         "Accuracy": "99%"
                     })
             
+            # ZeroBounce
+            if zb_result is not None:
+                if 'status' in zb_result:
+                    comparison_data.append({
+                        "Service": "ZeroBounce",
+                        "Status": zb_result['status'].capitalize(),
+                        "Format": "N/A",
+                        "Disposable": "✅ Yes" if zb_result.get('sub_status') == 'disposable' else "❌ No",
+                        "Cost": "Free (100/mo)",
+                        "Accuracy": "98%"
+                    })
+            
             if comparison_data:
                 df = pd.DataFrame(comparison_data)
                 st.dataframe(df, use_container_width=True)
@@ -507,6 +474,116 @@ if email:
                     """)
                 else:
                     st.warning("Add API keys in sidebar to compare professional services")
+        rerun_timer.lap('render_results')
+
+# Bulk list verification
+st.markdown("---")
+st.subheader("📂 Bulk List Verification")
+
+with st.expander("Verify a CSV list", expanded=False):
+    uploaded_file = st.file_uploader("Upload CSV:", type=["csv"])
+    input_path = st.text_input(
+        "...or path to a CSV on the server:",
+        help="Use a server-side path for very large lists"
+    )
+    bulk_col1, bulk_col2 = st.columns(2)
+    with bulk_col1:
+        email_column = st.text_input("Email column (blank = auto-detect):")
+        output_format = st.selectbox("Output format:", ["csv", "parquet"])
+    with bulk_col2:
+        output_path = st.text_input(
+            "Output file:",
+            value=f"verified_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        )
+        use_providers = st.checkbox(
+            "Send addresses that pass the basic check to professional APIs",
+            value=False
+        )
+        use_consensus = st.checkbox(
+            "Ask providers cheapest first and stop once the verdict is settled",
+            value=True,
+            help="Unchecked, every configured provider checks every address"
+        )
+        use_bulk_jobs = st.checkbox(
+            f"Use NeverBounce/ZeroBounce bulk jobs for {BULK_JOB_THRESHOLD:,}+ addresses",
+            value=True
+        )
+        use_mx_check = st.checkbox(
+            "Reject domains without mail servers (local DNS, free)",
+            value=True
+        )
+        use_smtp_probe = st.checkbox(
+            "Probe mailboxes over SMTP (needs outbound port 25)",
+            value=False
+        )
+        paid_check_budget = st.number_input(
+            "Max paid checks per provider (0 = no limit):",
+            min_value=0,
+            value=0,
+            help="When a provider's budget or credits run out, remaining rows get basic results only"
+        )
+    
+        job_id = st.text_input(
+            "Job ID (blank = new job):",
+            help="Enter the ID of an interrupted job to resume it where it stopped"
+        )
+    
+    if st.button("▶️ Run Bulk Verification"):
+        job_id = job_id.strip()
+        resuming = bool(job_id) and job_journal.get_job(job_id) is not None
+        source = uploaded_file if uploaded_file is not None else input_path.strip()
+        if not source and not resuming:
+            st.warning("Upload a CSV or enter a file path first.")
+        else:
+            job_id = job_id or new_job_id()
+            target = output_path if output_path.endswith(f".{output_format}") else f"{output_path}.{output_format}"
+            if uploaded_file is not None and not resuming:
+                # Uploads are saved next to the output so the job can be resumed later
+                source = f"{target}.input.csv"
+                with open(source, 'wb') as saved:
+                    saved.write(uploaded_file.getvalue())
+            st.info(f"{'Resuming' if resuming else 'Started'} job `{job_id}`")
+            progress = st.progress(0.0, text="Starting...")
+            try:
+                summary = run_job(
+                    verifier,
+                    job_journal,
+                    job_id,
+                    input_path=source,
+                    output_path=target,
+                    api_keys=st.session_state.api_keys if use_providers else {},
+                    email_column=email_column.strip() or None,
+                    output_format=output_format,
+                    bulk_job_threshold=BULK_JOB_THRESHOLD if use_bulk_jobs else None,
+                    consensus_threshold=CONSENSUS_THRESHOLD if use_consensus else None,
+                    paid_check_budget=paid_check_budget or None,
+                    mx_resolver=mx_resolver if use_mx_check or use_smtp_probe else None,
+                    smtp_prober=SMTPProber() if use_smtp_probe else None,
+                    on_progress=lambda rows, fraction: progress.progress(fraction, text=f"{rows:,} rows verified")
+                )
+            except Exception as e:
+                st.error(f"Bulk verification failed: {e}. Run job `{job_id}` again to resume.")
+            else:
+                progress.progress(1.0, text=f"{summary['rows']:,} rows verified")
+                st.success(f"Results written to {summary['output_path']}")
+                for job_error in summary['bulk_job_errors']:
+                    st.warning(f"Bulk job failed, fell back to single checks: {job_error}")
+                if summary['budget_exhausted']:
+                    st.warning("Provider credits ran out during the run; the remaining rows have basic results only.")
+                st.json(summary)
+    
+    recent_jobs = job_journal.list_jobs(limit=10)
+    if recent_jobs:
+        st.markdown("**Recent jobs**")
+        st.dataframe(pd.DataFrame([{
+            'Job ID': job['job_id'],
+            'Status': job['status'],
+            'Progress': f"{job['progress']:.0%}",
+            'Rows': job['summary'].get('rows', 0),
+            'Output': job['output_path'],
+            'Updated': datetime.fromtimestamp(job['updated_at']).strftime('%Y-%m-%d %H:%M:%S')
+        } for job in recent_jobs]), use_container_width=True, hide_index=True)
+rerun_timer.lap('bulk')
 
 # Feature showcase
 st.markdown("---")
@@ -551,4 +628,40 @@ st.markdown("""
     <p><strong>Professional Email Verifier v2.0</strong> | Basic + API Integration</p>
     <p>💡 <em>Tip: Start with free API tiers, upgrade as your needs grow</em></p>
 </div>
-""", unsafe_allow_html=True)
\ No newline at end of file
+""", unsafe_allow_html=True)
+rerun_timer.lap('showcase')
+
+# Diagnostics: provider latency, errors and cache hits since the process started
+phase_seconds = rerun_timer.finish()
+with st.sidebar:
+    with st.expander("🩺 Diagnostics", expanded=False):
+        diagnostics = METRICS.summary()
+        st.markdown("**This rerun**")
+        st.dataframe(pd.DataFrame([
+            {'Phase': phase, 'ms': round(seconds * 1000, 1)} for phase, seconds in phase_seconds.items()
+        ]), use_container_width=True, hide_index=True)
+        
+        st.markdown("**Provider calls**")
+        if diagnostics['providers']:
+            st.dataframe(pd.DataFrame(diagnostics['providers']).round(1), use_container_width=True, hide_index=True)
+        else:
+            st.caption("No provider calls yet")
+        
+        st.markdown("**Result cache**")
+        if diagnostics['cache']:
+            st.dataframe(pd.DataFrame(diagnostics['cache']).round(3), use_container_width=True, hide_index=True)
+        else:
+            st.caption("No cache lookups yet")
+        
+        if diagnostics['timers']:
+            st.markdown("**Timers**")
+            st.dataframe(pd.DataFrame(diagnostics['timers']).round(1), use_container_width=True, hide_index=True)
+        
+        st.download_button(
+            "Download Prometheus metrics",
+            METRICS.render_prometheus(),
+            file_name="email_verifier_metrics.txt",
+            mime="text/plain"
+        )
+        if METRICS_PORT:
+            st.caption(f"Scrape endpoint: http://localhost:{METRICS_PORT}/metrics")
@@ -0,0 +1,12 @@
+"""Email verification engine used by the Streamlit app and the command line
+
+Importing the package is cheap: pandas, requests and dnspython are only
+loaded by the modules (or code paths) that need them.
+"""
+from .cache import PersistentResultCache, VerificationCache
+from .health import KeyHealthMonitor
+from .limits import CreditLedger, TokenBucket, build_rate_limiters
+from .metrics import METRICS, MetricsRegistry
+from .results import flatten_provider_results, normalize_email
+from .suggest import DomainSuggester
+from .verifier import EMAIL_PATTERN, PROVIDER_DEADLINE, ProEmailVerifier
@@ -0,0 +1,247 @@
+"""Async provider transport and sessions that keep many checks in flight on one event loop"""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import aiohttp
+
+from .metrics import record_cache_lookup, record_provider_call
+from .providers import PROVIDER_CLIENTS
+from .scoring import CONSENSUS_THRESHOLD, provider_order, score_results
+from .transport import PROVIDER_BASE_URLS, RETRYABLE_STATUSES, RetryPolicy
+
+# Requests in flight across all providers, and per provider, for one session
+ASYNC_CONCURRENCY = 1000
+PROVIDER_CONCURRENCY = {
+    'hunter': 50,
+    'neverbounce': 200,
+    'zerobounce': 200
+}
+
+# aiohttp connection pool for one provider with the same retry policy as ProviderTransport
+class AsyncProviderTransport(RetryPolicy):
+    def __init__(self, base_url, max_connections=ASYNC_CONCURRENCY, sleep=asyncio.sleep, **retry_options):
+        super().__init__(base_url, **retry_options)
+        self.max_connections = max_connections
+        self.sleep = sleep
+        self._session = None
+    
+    @property
+    def session(self):
+        """aiohttp session, created on first use inside the running loop"""
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+                timeout=aiohttp.ClientTimeout(sock_connect=self.connect_timeout, sock_read=self.read_timeout)
+            )
+        return self._session
+    
+    async def request(self, method, path, retry_statuses=RETRYABLE_STATUSES, **kwargs):
+        """Send a request to base_url + path, retrying connection errors and retry_statuses
+        
+        The body is read before returning, so the connection is already back in the pool.
+        """
+        url = self.base_url + path
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with self.session.request(method, url, **kwargs) as response:
+                    await response.read()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == self.max_retries:
+                    raise
+                await self.sleep(self._retry_delay(attempt))
+                continue
+            if response.status not in retry_statuses or attempt == self.max_retries:
+                return response
+            await self.sleep(self._retry_delay(attempt, response, str(response.status)))
+    
+    async def get(self, path, params=None, **kwargs):
+        return await self.request('GET', path, params=params, **kwargs)
+    
+    async def get_json(self, path, params=None):
+        """Return (status_code, decoded body); the body is {} when it is not JSON"""
+        response = await self.get(path, params)
+        try:
+            data = await response.json(content_type=None)
+        except ValueError:
+            data = {}
+        return response.status, data if isinstance(data, dict) else {}
+    
+    async def aclose(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+def build_async_transports(base_urls=None, **options):
+    """Create one AsyncProviderTransport per provider"""
+    urls = dict(PROVIDER_BASE_URLS, **(base_urls or {}))
+    return {provider: AsyncProviderTransport(url, name=provider, **options) for provider, url in urls.items()}
+
+# Hands writes queued on the event loop to one thread, in batches
+class BatchWriter:
+    """write_batch(items) runs on a dedicated thread with every item queued
+    since the previous batch started, so one slow write never blocks the
+    loop and a busy loop still writes in large batches. aclose() waits for
+    the queue to drain and re-raises the first write error.
+    """
+    def __init__(self, write_batch, name='batch-writer'):
+        self.write_batch = write_batch
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=name)
+        self._queued = []
+        self._flushing = None
+        self._error = None
+    
+    def add(self, item):
+        self._queued.append(item)
+        if self._flushing is None:
+            self._flush()
+    
+    def _flush(self, done=None):
+        # Runs again as each batch lands, so items queued meanwhile go out in the next one
+        if done is not None and done.exception() is not None and self._error is None:
+            self._error = done.exception()
+        self._flushing = None
+        if self._queued:
+            batch, self._queued = self._queued, []
+            self._flushing = asyncio.get_running_loop().run_in_executor(self._executor, self.write_batch, batch)
+            self._flushing.add_done_callback(self._flush)
+    
+    async def aclose(self):
+        while self._flushing is not None:
+            await asyncio.wait([self._flushing])
+        self._executor.shutdown()
+        if self._error is not None:
+            raise self._error
+
+# Async provider checks for one event loop, sharing the verifier's caches, limits and ledger
+class AsyncVerifierSession:
+    """Bounded-concurrency async checks
+    
+    Create it inside the loop that will use it (async with
+    verifier.async_session() as session): the aiohttp sessions and semaphores
+    belong to that loop. A check waits for its provider's semaphore, its
+    credit and rate-limit token, then a global slot, so a slow or throttled
+    provider never holds slots the others could use. Fresh results reach the
+    persistent store through one writer thread, in batches; closing the
+    session waits for them.
+    """
+    def __init__(self, verifier, concurrency=ASYNC_CONCURRENCY, provider_concurrency=None, transports=None):
+        self.verifier = verifier
+        self._owns_transports = transports is None
+        limits = dict(PROVIDER_CONCURRENCY, **(provider_concurrency or {}))
+        self.transports = transports or build_async_transports(max_connections=max(limits.values()))
+        self._global_slots = asyncio.Semaphore(concurrency)
+        self._provider_slots = {provider: asyncio.Semaphore(n) for provider, n in limits.items()}
+        self._store_writer = BatchWriter(self._write_results, 'result-store')
+        self._store_misses = set()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+    
+    async def aclose(self):
+        try:
+            await self._store_writer.aclose()
+        finally:
+            if self._owns_transports:
+                for transport in self.transports.values():
+                    await transport.aclose()
+    
+    def _write_results(self, items):
+        """Store a batch of (provider, email, result), one transaction per provider"""
+        by_provider = {}
+        for provider, email, result in items:
+            by_provider.setdefault(provider, {})[email] = result
+        for provider, results in by_provider.items():
+            self.verifier.store.put_many(provider, results)
+    
+    async def _cached_result(self, provider, email, count=False):
+        """The verifier's cached result, with the SQLite store read on a worker thread"""
+        cached = self.verifier._memory_result(provider, email, count)
+        if cached is None and self.verifier.store is not None:
+            if (provider, email) in self._store_misses:
+                # _cached_providers just looked; its hits went to the memory cache
+                self._store_misses.discard((provider, email))
+                if count:
+                    record_cache_lookup(provider, 'store', False)
+            else:
+                cached = await asyncio.to_thread(self.verifier._stored_result, provider, email, count)
+        return cached
+    
+    async def _cached_providers(self, email, providers):
+        """Which of these providers already have an answer for email, in one store round trip"""
+        verifier = self.verifier
+        found = {p for p in providers if verifier._memory_result(p, email) is not None}
+        rest = [p for p in providers if p not in found]
+        if rest and verifier.store is not None:
+            found.update(await asyncio.to_thread(
+                lambda: {p for p in rest if verifier._stored_result(p, email) is not None}
+            ))
+            self._store_misses.update((p, email) for p in rest if p not in found)
+        return found
+    
+    async def verify(self, provider, email, api_key):
+        """Async counterpart of the verifier's cached single check
+        
+        Store reads run on worker threads and writes are queued, so SQLite never blocks the loop.
+        """
+        verifier = self.verifier
+        if not api_key:
+            return {'error': 'API key not configured'}
+        cached = await self._cached_result(provider, email, count=True)
+        if cached is not None:
+            return cached
+    
+        async with self._provider_slots[provider]:
+            if verifier.ledger is not None and not verifier.ledger.reserve(provider, api_key):
+                return {'error': 'Credit budget exhausted', 'budget_exhausted': True}
+            if provider in verifier.rate_limiters:
+                await verifier.rate_limiters[provider].acquire_async()
+            async with self._global_slots:
+                started = time.perf_counter()
+                result = await PROVIDER_CLIENTS[provider].verify_async(self.transports[provider], email, api_key)
+                record_provider_call(provider, result, time.perf_counter() - started)
+        verifier._record_result(provider, email, result, api_key, store=False)
+        if 'error' not in result and verifier.store is not None:
+            self._store_writer.add((provider, email, result))
+        return result
+    
+    async def hunter_verify(self, email, api_key):
+        return await self.verify('hunter', email, api_key)
+    
+    async def neverbounce_verify(self, email, api_key):
+        return await self.verify('neverbounce', email, api_key)
+    
+    async def zerobounce_verify(self, email, api_key):
+        return await self.verify('zerobounce', email, api_key)
+    
+    async def verify_all(self, email, api_keys):
+        """Check one address with every configured provider concurrently"""
+        configured = [p for p in PROVIDER_CLIENTS if api_keys.get(p)]
+        results = await asyncio.gather(*(self.verify(p, email, api_keys[p]) for p in configured))
+        return dict(zip(configured, results))
+    
+    async def verify_consensus(self, email, api_keys, basic_result, known=None, threshold=CONSENSUS_THRESHOLD):
+        """Call providers cheapest first until the consensus reaches threshold
+        
+        known holds results already in hand (they count as evidence and are
+        not fetched again). Returns only the results fetched here.
+        """
+        results = dict(known or {})
+        fresh = {}
+        pending = [p for p in PROVIDER_CLIENTS if api_keys.get(p) and p not in results]
+        cached = await self._cached_providers(email, pending)
+        for provider in provider_order(pending, cached.__contains__):
+            if score_results(basic_result, results)['confidence'] >= threshold:
+                break
+            fresh[provider] = results[provider] = await self.verify(provider, email, api_keys[provider])
+        self._store_misses.difference_update((p, email) for p in pending)
+        return fresh
+    
+    async def verify_many(self, emails, api_keys):
+        """Check many addresses at once: {email: {provider: result}}"""
+        emails = list(dict.fromkeys(emails))
+        results = await asyncio.gather(*(self.verify_all(email, api_keys) for email in emails))
+        return dict(zip(emails, results))
@@ -0,0 +1,415 @@
+"""Streaming bulk verification of CSV lists (requires pandas)"""
+import asyncio
+
+import pandas as pd
+
+from .bulk_jobs import BULK_JOB_CLIENTS, BULK_JOB_THRESHOLD
+from .records import result_table, to_pandas
+from .results import ProviderColumns, find_email_column, normalize_email
+from .scoring import CONSENSUS_THRESHOLD, provider_order, score_results
+
+# Rows read from the input list per chunk in bulk mode
+BULK_CHUNK_SIZE = 10000
+
+# Addresses per domain checked one at a time before the rest of the domain runs concurrently
+DOMAIN_PROBE_ADDRESSES = 2
+
+# basic_verify_many columns the consensus verdict reads
+BASIC_SCORE_FIELDS = ('basic_format', 'basic_disposable', 'basic_suggestion')
+
+def plan_verification(basic):
+    """Group the distinct addresses that still need provider checks by domain
+    
+    Takes the output of basic_verify_many and returns {domain: [email, ...]}
+    with addresses normalized and exact duplicates collapsed.
+    """
+    candidates = basic.loc[basic['basic_status'] == 'Valid (Basic Check)', 'email']
+    candidates = candidates.map(normalize_email).drop_duplicates()
+    domains = candidates.str.split('@', n=1).str[1]
+    return {domain: list(group) for domain, group in candidates.groupby(domains, sort=False)}
+
+def collect_candidates(verifier, reader, email_column, start_chunk=0, mx_resolver=None):
+    """Every distinct address in a chunked list that would be sent to the providers
+    
+    Returns {normalized email: basic_suggestion}, skipping the first
+    start_chunk chunks and, with mx_resolver set, domains without mail servers.
+    """
+    candidates = {}
+    for chunk_index, chunk in enumerate(reader):
+        if chunk_index < start_chunk:
+            continue
+        basic = verifier.basic_verify_many(chunk[email_column].str.strip())
+        plan = plan_verification(basic)
+        if mx_resolver is not None and plan:
+            mx_results = mx_resolver.resolve_many(plan)
+            plan = {d: emails for d, emails in plan.items() if mx_results[d]['has_mx'] is not False}
+        typos = basic['basic_suggestion'] != ''
+        suggestion_by_email = dict(zip(basic.loc[typos, 'email'].map(normalize_email),
+                                       basic.loc[typos, 'basic_suggestion']))
+        for emails in plan.values():
+            for email in emails:
+                candidates.setdefault(email, suggestion_by_email.get(email, ''))
+    return candidates
+
+def run_bulk_jobs(verifier, candidates, api_keys, bulk_job_threshold=BULK_JOB_THRESHOLD,
+                  consensus_threshold=CONSENSUS_THRESHOLD, summary=None, journal=None):
+    """Send candidates ({email: basic_suggestion}) to each bulk-capable provider as one job
+    
+    Providers go cheapest first, and with consensus on a later provider only
+    gets the addresses the answers in hand leave unsettled. Returns
+    {provider: {email: result}}; a job that fails is noted in
+    summary['bulk_job_errors'] and its addresses fall back to single checks.
+    """
+    summary = summary if summary is not None else {'bulk_jobs': 0, 'bulk_job_errors': []}
+    emails = list(candidates)
+    stored = verifier.lookup_many(emails, list(api_keys))
+    journaled = journal.get_many(emails) if journal is not None else {}
+    for email, results in journaled.items():
+        for provider, result in results.items():
+            stored.setdefault(provider, {})[email] = result
+    
+    def settled(email):
+        basic_passed = {'basic_format': True, 'basic_disposable': False, 'basic_suggestion': candidates[email]}
+        known = {p: stored[p][email] for p in api_keys if email in stored[p]}
+        return score_results(basic_passed, known)['confidence'] >= consensus_threshold
+    
+    job_results = {}
+    for provider in provider_order(list(api_keys)):
+        if provider not in BULK_JOB_CLIENTS:
+            continue
+        pending = [e for e in emails if e not in stored[provider]]
+        if consensus_threshold is not None:
+            pending = [e for e in pending if not settled(e)]
+        if verifier.ledger is not None:
+            allowance = verifier.ledger.allowance(provider, api_keys[provider])
+            if allowance is not None:
+                pending = pending[:allowance]
+        if len(pending) < bulk_job_threshold:
+            continue
+        try:
+            results = verifier.run_bulk_job(provider, pending, api_keys[provider])
+        except Exception as e:
+            # Whatever the job did not return falls back to single checks
+            summary['bulk_job_errors'].append(f"{provider}: {e}")
+            continue
+        stored[provider].update(results)
+        job_results[provider] = results
+        summary['bulk_jobs'] += 1
+        if journal is not None:
+            journal.put_many((email, {provider: result}) for email, result in results.items())
+    return job_results
+
+# Facts that hold for every address on a domain, learned once from provider results
+class DomainFacts:
+    def __init__(self):
+        self._facts = {}
+    
+    def get(self, domain):
+        return self._facts.get(domain, {'mx': None, 'catch_all': None})
+    
+    def learn(self, domain, provider, result):
+        """Record domain-level signals from one provider response"""
+        if 'error' in result:
+            return
+        facts = self._facts.setdefault(domain, {'mx': None, 'catch_all': None})
+        if provider == 'hunter':
+            facts['mx'] = bool(result.get('mx_records'))
+            facts['catch_all'] = bool(result.get('accept_all'))
+        elif provider == 'neverbounce':
+            if result.get('result') == 'catchall':
+                facts['catch_all'] = True
+            elif result.get('result') == 'valid':
+                facts['catch_all'] = False
+            if 'has_dns_mx' in result.get('flags', []):
+                facts['mx'] = True
+        elif provider == 'zerobounce':
+            if result.get('status') == 'catch-all':
+                facts['catch_all'] = True
+            mx_found = str(result.get('mx_found', '')).lower()
+            if mx_found in ('true', 'false'):
+                facts['mx'] = mx_found == 'true'
+    
+    def learn_local(self, domain, has_mx=None, catch_all=None):
+        """Record signals from the local DNS/SMTP checks"""
+        facts = self._facts.setdefault(domain, {'mx': None, 'catch_all': None})
+        if has_mx is not None:
+            facts['mx'] = has_mx
+        if catch_all is not None:
+            facts['catch_all'] = catch_all
+    
+    def skip_reason(self, domain):
+        """Why paid checks for this domain would be wasted, or None"""
+        facts = self.get(domain)
+        if facts['mx'] is False:
+            return 'No MX records'
+        if facts['catch_all']:
+            return 'Catch-all domain'
+        return None
+
+# Writes result chunks to disk as they are produced
+class ChunkWriter:
+    def __init__(self, path, output_format='csv'):
+        self.path = path
+        self.output_format = output_format
+        self._parquet_writer = None
+        self._wrote_header = False
+    
+    def write(self, table):
+        """Append one RESULT_SCHEMA table"""
+        if self.output_format == 'parquet':
+            import pyarrow.parquet as pq
+            if self._parquet_writer is None:
+                self._parquet_writer = pq.ParquetWriter(self.path, table.schema)
+            self._parquet_writer.write_table(table)
+        else:
+            to_pandas(table).to_csv(self.path, mode='a' if self._wrote_header else 'w',
+                                    header=not self._wrote_header, index=False)
+            self._wrote_header = True
+    
+    def close(self):
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+
+def run_bulk_verification(verifier, source, output_path, api_keys=None, email_column=None,
+                          output_format='csv', chunksize=BULK_CHUNK_SIZE, on_progress=None,
+                          bulk_job_threshold=BULK_JOB_THRESHOLD, mx_resolver=None, smtp_prober=None,
+                          consensus_threshold=CONSENSUS_THRESHOLD, writer=None, start_chunk=0,
+                          initial_summary=None, journal=None, on_chunk_done=None, paid_check_budget=None):
+    """Verify a CSV list chunk by chunk and stream the results to output_path
+    
+    Only addresses that pass the basic check are sent to the configured
+    providers, once per distinct address, and domains already known to lack
+    MX records or to accept all mail are not checked again. Memory use is
+    bounded by the chunk size, not the list size. Single checks run on one
+    event loop, domains and their addresses concurrently, within the session's
+    concurrency caps and the verifier's rate limiters, and once a provider's
+    credits run out the remaining rows fall back to basic results only. When at least
+    bulk_job_threshold addresses in the whole list still need NeverBounce or
+    ZeroBounce, they go out as one bulk job per provider before the first
+    chunk and the job results are held for the run (None disables this).
+    With mx_resolver (and optionally smtp_prober) set, domains without mail
+    servers and mailboxes the SMTP server rejects are settled locally.
+    Providers are called cheapest first and the rest are skipped once the
+    consensus verdict reaches consensus_threshold (None calls every one).
+    on_progress(rows_done, fraction) is called after every chunk.
+    paid_check_budget caps paid checks per provider for this run only.
+    
+    Resumable jobs pass their own writer, skip the first start_chunk chunks,
+    seed the counters from initial_summary and get on_chunk_done(index,
+    summary) after each chunk is written. A journal (get_many/put_many) supplies
+    provider results already paid for and records new ones as they arrive.
+    """
+    from .async_clients import BatchWriter
+    
+    api_keys = api_keys or {}
+    
+    handle = source if hasattr(source, 'read') else open(source, 'rb')
+    total_bytes = handle.seek(0, 2)
+    handle.seek(0)
+    if email_column is None:
+        email_column = find_email_column(list(pd.read_csv(handle, nrows=0).columns))
+        handle.seek(0)
+    
+    summary = {'rows': 0, 'basic_valid': 0, 'basic_typos': 0, 'provider_checked': 0, 'provider_skipped': 0,
+               'budget_exhausted': False, 'bulk_jobs': 0, 'bulk_job_errors': [],
+               'output_path': output_path}
+    summary.update(initial_summary or {})
+    domain_facts = DomainFacts()
+    writer = writer or ChunkWriter(output_path, output_format)
+    # The budget applies to each key's account while the run lasts and is lifted afterwards
+    budgeted = []
+    if paid_check_budget is not None and verifier.ledger is not None:
+        budgeted = [(provider, api_key) for provider, api_key in api_keys.items() if api_key]
+        for provider, api_key in budgeted:
+            verifier.ledger.set_budget(provider, paid_check_budget, api_key)
+    configured = [p for p in api_keys if api_keys[p]]
+    try:
+        # Bulk jobs cover the whole list: one pass collects every address that will need a
+        # provider, and each bulk-capable provider gets a single job before the first chunk
+        job_results = {}
+        if bulk_job_threshold and any(p in BULK_JOB_CLIENTS for p in configured):
+            reader = pd.read_csv(handle, usecols=[email_column], dtype=str,
+                                 chunksize=chunksize, keep_default_na=False)
+            candidates = collect_candidates(verifier, reader, email_column, start_chunk, mx_resolver)
+            handle.seek(0)
+            job_results = run_bulk_jobs(verifier, candidates, {p: api_keys[p] for p in configured},
+                                        bulk_job_threshold, consensus_threshold, summary, journal)
+        
+        reader = pd.read_csv(handle, usecols=[email_column], dtype=str,
+                             chunksize=chunksize, keep_default_na=False)
+        for chunk_index, chunk in enumerate(reader):
+            if chunk_index < start_chunk:
+                continue
+            basic = verifier.basic_verify_many(chunk[email_column].str.strip())
+            basic = basic.reset_index(drop=True)
+            valid = basic['basic_status'] == 'Valid (Basic Check)'
+            summary['basic_valid'] += int(valid.sum())
+            summary['basic_typos'] += int((basic['basic_suggestion'] != '').sum())
+            
+            # Providers see each distinct address once; domain facts short-circuit the rest
+            provider_by_email = {}
+            skipped = {}
+            smtp_by_email = {}
+            plan = {}
+            if any(api_keys.values()) or mx_resolver is not None or smtp_prober is not None:
+                plan = plan_verification(basic)
+            
+            # Local DNS/SMTP checks reject dead domains and mailboxes before any paid call
+            mx_results = {}
+            if mx_resolver is not None and plan:
+                mx_results = mx_resolver.resolve_many(plan)
+                for domain, mx in mx_results.items():
+                    domain_facts.learn_local(domain, has_mx=mx['has_mx'])
+            if smtp_prober is not None and plan:
+                live = {d: emails for d, emails in plan.items() if domain_facts.skip_reason(d) is None}
+                smtp_by_email, catch_all = smtp_prober.probe_many(
+                    live, {d: mx.get('mx_hosts', []) for d, mx in mx_results.items()}
+                )
+                for domain, is_catch_all in catch_all.items():
+                    domain_facts.learn_local(domain, catch_all=is_catch_all)
+            
+            if configured:
+                planned = [
+                    e for d, emails in plan.items() if domain_facts.skip_reason(d) is None
+                    for e in emails if smtp_by_email.get(e, {}).get('status') != 'undeliverable'
+                ]
+                stored = verifier.lookup_many(planned, configured)
+                journaled = journal.get_many(planned) if journal is not None else {}
+                for email, results in journaled.items():
+                    for provider, result in results.items():
+                        stored.setdefault(provider, {})[email] = result
+                for provider, results in job_results.items():
+                    stored[provider].update((e, results[e]) for e in planned if e in results)
+                # Answers already in hand teach the domain facts before any paid call is made
+                for provider, results in stored.items():
+                    for email, result in results.items():
+                        domain_facts.learn(email.rpartition('@')[2], provider, result)
+                
+                # Planned rows passed the basic check; a typo suggestion still lowers their odds
+                typos = basic['basic_suggestion'] != ''
+                suggestion_by_email = dict(zip(basic.loc[typos, 'email'].map(normalize_email),
+                                               basic.loc[typos, 'basic_suggestion']))
+                
+                def basic_passed(email):
+                    return {'basic_format': True, 'basic_disposable': False,
+                            'basic_suggestion': suggestion_by_email.get(email, '')}
+                
+                async def check_email(session, domain, email):
+                    results = {p: stored[p][email] for p in configured if email in stored[p]}
+                    reason = domain_facts.skip_reason(domain)
+                    if not reason and smtp_by_email.get(email, {}).get('status') == 'undeliverable':
+                        reason = 'Rejected by SMTP server'
+                    if reason:
+                        # No new calls, but answers already paid for stay on the row
+                        if results:
+                            provider_by_email[email] = results
+                        else:
+                            skipped[email] = reason
+                        return
+                    missing = {p: api_keys[p] for p in configured if p not in results}
+                    # Providers out of credits drop out; the row keeps its basic result
+                    if verifier.ledger is not None:
+                        missing = {p: k for p, k in missing.items() if verifier.ledger.has_credit(p, k)}
+                    if not results and not missing:
+                        skipped[email] = 'Credit budget exhausted'
+                        summary['budget_exhausted'] = True
+                        return
+                    if missing:
+                        if consensus_threshold is None:
+                            fresh = await session.verify_all(email, missing)
+                        else:
+                            # Stops once the answers in hand settle the verdict
+                            fresh = await session.verify_consensus(
+                                email, missing, basic_passed(email), results, consensus_threshold
+                            )
+                        results.update(fresh)
+                        if journal_writer is not None:
+                            journal_writer.add((email, {p: r for p, r in fresh.items() if 'error' not in r}))
+                    for provider, result in results.items():
+                        domain_facts.learn(domain, provider, result)
+                    provider_by_email[email] = results
+                
+                async def check_domain(session, domain, emails):
+                    # The first addresses go in order to learn whether the domain is catch-all or
+                    # dead; the rest then run concurrently and still skip once that is known
+                    for email in emails[:DOMAIN_PROBE_ADDRESSES]:
+                        await check_email(session, domain, email)
+                    await asyncio.gather(*(check_email(session, domain, e) for e in emails[DOMAIN_PROBE_ADDRESSES:]))
+                
+                # Fresh answers reach the journal in batches from one thread, never on the loop
+                journal_writer = BatchWriter(journal.put_many, 'job-journal') if journal is not None else None
+                
+                async def check_all():
+                    # Domains run concurrently on one event loop, bounded by the session semaphores
+                    async with verifier.async_session() as session:
+                        try:
+                            await asyncio.gather(*(check_domain(session, d, emails) for d, emails in plan.items()))
+                        finally:
+                            if journal_writer is not None:
+                                await journal_writer.aclose()
+                
+                asyncio.run(check_all())
+                summary['provider_checked'] += len(provider_by_email)
+                summary['provider_skipped'] += len(skipped)
+                summary['budget_exhausted'] |= any(
+                    r.get('budget_exhausted') for results in provider_by_email.values() for r in results.values()
+                )
+            
+            normalized = basic['email'].map(normalize_email)
+            domains = normalized.str.split('@', n=1).str[1]
+            chunk_facts = {d: domain_facts.get(d) for d in domains.dropna().unique()}
+            # Provider answers go straight into columns; rows without any are scored on what the
+            # domain facts and SMTP probe ruled out, or else share one basic-only verdict
+            ruled_out = {d: {'has_mx': f['mx'], 'catch_all': f['catch_all']}
+                         for d, f in chunk_facts.items() if f['mx'] is False or f['catch_all']}
+            rejected = {e: r for e, r in smtp_by_email.items() if r.get('status') == 'undeliverable'}
+            provider_columns = ProviderColumns()
+            verdicts = []
+            confidences = []
+            basic_only = {}
+            basic_keys = zip(basic['basic_format'], basic['basic_disposable'], basic['basic_suggestion'])
+            for email, domain, key in zip(normalized, domains, basic_keys):
+                results = provider_by_email.get(email)
+                provider_columns.append(results or {})
+                if results:
+                    consensus = score_results(dict(zip(BASIC_SCORE_FIELDS, key)), results)
+                elif domain in ruled_out or email in rejected:
+                    local = {'dns': ruled_out.get(domain), 'smtp': rejected.get(email)}
+                    consensus = score_results(dict(zip(BASIC_SCORE_FIELDS, key)), local)
+                else:
+                    consensus = basic_only.get(key)
+                    if consensus is None:
+                        consensus = basic_only[key] = score_results(dict(zip(BASIC_SCORE_FIELDS, key)), {})
+                verdicts.append(consensus['verdict'])
+                confidences.append(consensus['confidence'])
+            rows = result_table({
+                'email': basic['email'],
+                'basic_format': basic['basic_format'],
+                'basic_disposable': basic['basic_disposable'],
+                'basic_status': basic['basic_status'],
+                'basic_suggestion': basic['basic_suggestion'],
+                **provider_columns.columns,
+                'provider_skipped': normalized.map(skipped).fillna(''),
+                'smtp_status': normalized.map({e: r['status'] for e, r in smtp_by_email.items()}).fillna(''),
+                'domain_mx': domains.map({d: f['mx'] for d, f in chunk_facts.items()}),
+                'domain_catch_all': domains.map({d: f['catch_all'] for d, f in chunk_facts.items()}),
+                'verdict': verdicts,
+                'confidence': confidences
+            })
+            
+            # CSV output consumes the table, so count the rows first
+            summary['rows'] += rows.num_rows
+            writer.write(rows)
+            if on_chunk_done is not None:
+                on_chunk_done(chunk_index, summary)
+            if on_progress is not None:
+                fraction = min(handle.tell() / total_bytes, 1.0) if total_bytes else 1.0
+                on_progress(summary['rows'], fraction)
+    finally:
+        for provider, api_key in budgeted:
+            verifier.ledger.set_budget(provider, None, api_key)
+        writer.close()
+        if handle is not source:
+            handle.close()
+    return summary
@@ -0,0 +1,165 @@
+"""Provider bulk job APIs for verifying whole lists at once"""
+import csv
+import time
+from io import StringIO
+
+from .results import normalize_neverbounce, normalize_zerobounce
+
+# Lists with at least this many unchecked addresses go through provider bulk jobs
+BULK_JOB_THRESHOLD = 1000
+BULK_JOB_POLL_INTERVAL = 5
+BULK_JOB_TIMEOUT = 3600
+
+# Submits a whole list as one provider job, waits for it, then streams the results
+class BulkJob:
+    provider = None
+    
+    def __init__(self, transport, api_key, poll_interval=BULK_JOB_POLL_INTERVAL, sleep=time.sleep):
+        self.transport = transport
+        self.api_key = api_key
+        self.poll_interval = poll_interval
+        self.sleep = sleep
+    
+    def submit(self, emails):
+        """Create the job and return its id"""
+        raise NotImplementedError
+    
+    def status(self, job_id):
+        """Return (state, percent complete) where state is running, complete or failed"""
+        raise NotImplementedError
+    
+    def iter_results(self, job_id):
+        """Yield (email, normalized result) for a finished job"""
+        raise NotImplementedError
+    
+    def wait(self, job_id, timeout=BULK_JOB_TIMEOUT, on_progress=None):
+        deadline = time.monotonic() + timeout
+        while True:
+            state, percent = self.status(job_id)
+            if on_progress is not None:
+                on_progress(percent)
+            if state == 'complete':
+                return
+            if state == 'failed':
+                raise RuntimeError(f"{self.provider} bulk job {job_id} failed")
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"{self.provider} bulk job {job_id} did not finish in {timeout}s")
+            self.sleep(self.poll_interval)
+    
+    def run(self, emails, timeout=BULK_JOB_TIMEOUT, on_progress=None):
+        job_id = self.submit(emails)
+        self.wait(job_id, timeout, on_progress)
+        yield from self.iter_results(job_id)
+
+class NeverBounceBulkJob(BulkJob):
+    provider = 'neverbounce'
+    results_page_size = 1000
+    
+    def submit(self, emails):
+        response = self.transport.request('POST', '/v4/jobs/create', retry_statuses={429}, json={
+            'key': self.api_key,
+            'input_location': 'supplied',
+            'input': [{'email': email} for email in emails],
+            'auto_parse': 1,
+            'auto_start': 1
+        })
+        status_code, data = self.transport.decode(response)
+        if status_code != 200 or data.get('status') != 'success':
+            raise RuntimeError(data.get('message', 'Could not create NeverBounce job'))
+        return data['job_id']
+    
+    def status(self, job_id):
+        status_code, data = self.transport.get_json('/v4/jobs/status', {'key': self.api_key, 'job_id': job_id})
+        if status_code != 200 or data.get('status') != 'success':
+            raise RuntimeError(data.get('message', 'Could not read NeverBounce job status'))
+        job_status = data.get('job_status', '')
+        state = {'complete': 'complete', 'failed': 'failed'}.get(job_status, 'running')
+        return state, float(data.get('percent_complete', 0) or 0)
+    
+    def iter_results(self, job_id):
+        page = 1
+        while True:
+            status_code, data = self.transport.get_json('/v4/jobs/results', {
+                'key': self.api_key,
+                'job_id': job_id,
+                'page': page,
+                'items_per_page': self.results_page_size
+            })
+            if status_code != 200 or data.get('status') != 'success':
+                raise RuntimeError(data.get('message', 'Could not download NeverBounce results'))
+            for item in data.get('results', []):
+                yield item.get('data', {}).get('email', ''), normalize_neverbounce(item.get('verification', {}))
+            if page >= data.get('total_pages', 1):
+                return
+            page += 1
+
+# Column names in ZeroBounce result files mapped to validate-response fields
+ZEROBOUNCE_FILE_COLUMNS = {
+    'ZB Status': 'status',
+    'ZB Sub Status': 'sub_status',
+    'ZB Account': 'account',
+    'ZB Domain': 'domain',
+    'ZB Did You Mean': 'did_you_mean',
+    'ZB Domain Age': 'domain_age_days',
+    'ZB SMTP Provider': 'smtp_provider',
+    'ZB MX Found': 'mx_found',
+    'ZB MX Record': 'mx_record',
+    'ZB First Name': 'firstname',
+    'ZB Last Name': 'lastname',
+    'ZB Gender': 'gender',
+    'ZB Country': 'country',
+    'ZB Region': 'region',
+    'ZB City': 'city',
+    'ZB ZipCode': 'zipcode',
+    'ZB Processed At': 'processed_at'
+}
+
+class ZeroBounceBulkJob(BulkJob):
+    provider = 'zerobounce'
+    
+    def submit(self, emails):
+        upload = StringIO()
+        writer = csv.writer(upload)
+        writer.writerow(['email'])
+        writer.writerows([email] for email in emails)
+        response = self.transport.request(
+            'POST', '/v2/sendfile', retry_statuses={429},
+            data={'api_key': self.api_key, 'email_address_column': 1, 'has_header_row': 'true'},
+            files={'file': ('emails.csv', upload.getvalue(), 'text/csv')}
+        )
+        status_code, data = self.transport.decode(response)
+        if status_code != 200 or not data.get('success'):
+            raise RuntimeError(data.get('message', 'Could not upload ZeroBounce file'))
+        return data['file_id']
+    
+    def status(self, job_id):
+        status_code, data = self.transport.get_json('/v2/filestatus', {'api_key': self.api_key, 'file_id': job_id})
+        if status_code != 200 or data.get('success') is False:
+            raise RuntimeError(data.get('message', 'Could not read ZeroBounce file status'))
+        file_status = str(data.get('file_status', '')).lower()
+        if file_status == 'complete':
+            state = 'complete'
+        elif file_status.startswith(('fail', 'error', 'deleted')):
+            state = 'failed'
+        else:
+            state = 'running'
+        percent = str(data.get('complete_percentage', '0')).rstrip('%') or 0
+        return state, float(percent)
+    
+    def iter_results(self, job_id):
+        response = self.transport.get('/v2/getfile', {'api_key': self.api_key, 'file_id': job_id}, stream=True)
+        with response:
+            if response.status_code != 200 or 'json' in response.headers.get('Content-Type', ''):
+                raise RuntimeError(self.transport.decode(response)[1].get('message', 'Could not download ZeroBounce results'))
+            response.encoding = response.encoding or 'utf-8'
+            for row in csv.DictReader(response.iter_lines(decode_unicode=True)):
+                email = row.get('email') or row.get('Email Address', '')
+                fields = {key: row.get(column, '') for column, key in ZEROBOUNCE_FILE_COLUMNS.items()}
+                fields['status'] = (fields['status'] or 'unknown').lower()
+                fields['sub_status'] = fields['sub_status'].lower()
+                yield email, normalize_zerobounce(fields)
+
+BULK_JOB_CLIENTS = {
+    'neverbounce': (NeverBounceBulkJob, 'neverbounce'),
+    'zerobounce': (ZeroBounceBulkJob, 'zerobounce_bulk')
+}
@@ -0,0 +1,133 @@
+"""In-memory and on-disk caches for provider results"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from .results import normalize_email
+
+# Provider results are reused for this long before the API is asked again
+RESULT_CACHE_TTL = 3600
+RESULT_CACHE_SIZE = 1024
+
+# Bounded LRU cache for provider results
+class VerificationCache:
+    def __init__(self, max_entries=RESULT_CACHE_SIZE, ttl=RESULT_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, provider, email):
+        """Return the cached result or None if missing or expired"""
+        key = (provider, normalize_email(email))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if expires_at < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return result
+    
+    def put(self, provider, email, result):
+        """Store a result, evicting the least recently used entries"""
+        key = (provider, normalize_email(email))
+        with self._lock:
+            self._entries[key] = (time.time() + self.ttl, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self):
+        return len(self._entries)
+
+# On-disk cache shared by every session and app process on this machine
+RESULT_DB_PATH = os.environ.get('EMAIL_VERIFIER_CACHE_DB', 'verification_cache.db')
+
+# How long each provider's answer stays valid in the on-disk cache (seconds)
+PROVIDER_CACHE_TTLS = {
+    'hunter': 30 * 86400,
+    'neverbounce': 14 * 86400,
+    'zerobounce': 14 * 86400
+}
+
+# SQLite-backed provider result store, safe for concurrent processes (WAL mode)
+class PersistentResultCache:
+    def __init__(self, path=RESULT_DB_PATH, ttls=None):
+        self.path = path
+        self.ttls = dict(PROVIDER_CACHE_TTLS, **(ttls or {}))
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS results (
+                    provider TEXT NOT NULL,
+                    email TEXT NOT NULL,
+                    result TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    PRIMARY KEY (provider, email)
+                ) WITHOUT ROWID
+            """)
+    
+    def _connect(self):
+        """One connection per thread; sqlite3 connections are not thread-safe"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS lookup_keys (email TEXT PRIMARY KEY)")
+            self._local.conn = conn
+        return conn
+    
+    def get(self, provider, email):
+        """Return the stored result or None if missing or expired"""
+        row = self._connect().execute(
+            "SELECT result FROM results WHERE provider = ? AND email = ? AND expires_at > ?",
+            (provider, normalize_email(email), time.time())
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def put(self, provider, email, result):
+        self.put_many(provider, {email: result})
+    
+    def get_many(self, provider, emails):
+        """Look up many addresses in a single query; returns {normalized email: result}"""
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM lookup_keys")
+            conn.executemany("INSERT OR IGNORE INTO lookup_keys (email) VALUES (?)",
+                             ((normalize_email(e),) for e in emails))
+            rows = conn.execute("""
+                SELECT r.email, r.result FROM results r
+                JOIN lookup_keys k ON r.email = k.email
+                WHERE r.provider = ? AND r.expires_at > ?
+            """, (provider, time.time())).fetchall()
+            conn.execute("DELETE FROM lookup_keys")
+        return {email: json.loads(result) for email, result in rows}
+    
+    def put_many(self, provider, results):
+        """Store {email: result} for one provider in a single transaction"""
+        expires_at = time.time() + self.ttls.get(provider, RESULT_CACHE_TTL)
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO results (provider, email, result, expires_at) VALUES (?, ?, ?, ?)",
+                ((provider, normalize_email(email), json.dumps(result), expires_at)
+                 for email, result in results.items())
+            )
+    
+    def purge_expired(self):
+        """Delete expired rows and return how many were removed"""
+        conn = self._connect()
+        with conn:
+            return conn.execute("DELETE FROM results WHERE expires_at <= ?", (time.time(),)).rowcount
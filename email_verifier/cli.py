@@ -0,0 +1,240 @@
+"""Command-line entry point: python -m email_verifier verify --input list.csv"""
+import argparse
+import csv
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from .results import find_email_column, flatten_provider_results
+
+PROVIDERS = ('hunter', 'neverbounce', 'zerobounce')
+
+# API keys are read from the environment so they never appear in shell history
+API_KEY_ENV = {
+    'hunter': 'HUNTER_API_KEY',
+    'neverbounce': 'NEVERBOUNCE_API_KEY',
+    'zerobounce': 'ZEROBOUNCE_API_KEY'
+}
+
+BASIC_COLUMNS = ['email', 'basic_format', 'basic_disposable', 'basic_status', 'basic_suggestion']
+
+def parse_providers(value):
+    providers = [p.strip().lower() for p in value.split(',') if p.strip()]
+    unknown = [p for p in providers if p != 'basic' and p not in PROVIDERS]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown provider(s): {', '.join(unknown)}")
+    return [p for p in providers if p != 'basic']
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m email_verifier', description='Verify email addresses without the web UI.')
+    commands = parser.add_subparsers(dest='command', required=True)
+    
+    verify = commands.add_parser('verify', help='Stream addresses from a file or stdin and write one result per line')
+    verify.add_argument('--input', default='-', help='CSV or one-address-per-line file (default: stdin)')
+    verify.add_argument('--output', default='-', help='Output file (default: stdout)')
+    verify.add_argument('--column', help='Email column name in a CSV with a header row')
+    verify.add_argument('--providers', type=parse_providers, default=[], help='Comma list: basic,hunter,neverbounce,zerobounce')
+    verify.add_argument('--workers', type=int, default=8, help='Addresses checked with providers in parallel')
+    verify.add_argument('--format', choices=['csv', 'jsonl'], default='csv')
+    verify.add_argument('--deadline', type=float, default=None, help='Per-address provider time budget in seconds (with --all-providers)')
+    verify.add_argument('--all-providers', action='store_true', help='Ask every provider at once instead of cheapest first until settled')
+    verify.add_argument('--no-cache', action='store_true', help='Do not read or write the on-disk result cache')
+    verify.add_argument('--metrics', help='Write provider latency, error and cache metrics (Prometheus text) here when done')
+    
+    bulk = commands.add_parser('bulk', help='Chunked CSV run with dedup, bulk jobs and Parquet output (needs pandas)')
+    bulk.add_argument('--input', required=True, help='Input CSV path')
+    bulk.add_argument('--output', required=True, help='Output path; a .parquet suffix writes Parquet')
+    bulk.add_argument('--column', help='Email column name (default: auto-detect)')
+    bulk.add_argument('--providers', type=parse_providers, default=[], help='Comma list: basic,hunter,neverbounce,zerobounce')
+    bulk.add_argument('--chunk-size', type=int, default=None)
+    bulk.add_argument('--mx-check', action='store_true', help='Reject domains without mail servers via local DNS')
+    bulk.add_argument('--smtp-probe', action='store_true', help='Probe mailboxes over SMTP (implies --mx-check)')
+    bulk.add_argument('--no-bulk-jobs', action='store_true', help='Always use single-check endpoints')
+    bulk.add_argument('--all-providers', action='store_true', help='Ask every provider instead of cheapest first until settled')
+    bulk.add_argument('--max-paid-checks', type=int, default=None, help='Cap paid checks per provider for this run')
+    bulk.add_argument('--job-id', help='Run as a resumable job; rerun with the same ID to resume after a crash')
+    bulk.add_argument('--metrics', help='Write provider latency, error and cache metrics (Prometheus text) here when done')
+    
+    batch = commands.add_parser('batch', help='Basic checks only, sharded across processes and resumable after a crash')
+    batch.add_argument('--input', required=True, help='Input CSV path')
+    batch.add_argument('--output', required=True, help='Output CSV path')
+    batch.add_argument('--column', help='Email column name (default: auto-detect)')
+    batch.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    batch.add_argument('--shards', type=int, default=None, help='Number of shards (default: 4 per worker)')
+    batch.add_argument('--work-dir', help='Checkpoint directory (default: <output>.shards)')
+    return parser
+
+def api_keys_for(parser, providers):
+    keys = {}
+    for provider in providers:
+        key = os.environ.get(API_KEY_ENV[provider], '')
+        if not key:
+            parser.error(f"{API_KEY_ENV[provider]} must be set to use {provider}")
+        keys[provider] = key
+    return keys
+
+def build_verifier(providers, use_store=True):
+    from .cache import PersistentResultCache, VerificationCache
+    from .limits import CreditLedger
+    from .verifier import ProEmailVerifier
+    
+    store = PersistentResultCache() if providers and use_store else None
+    return ProEmailVerifier(cache=VerificationCache(), store=store, ledger=CreditLedger())
+
+def read_emails(handle, column=None):
+    """Yield addresses from a CSV (with or without header) or a plain list"""
+    reader = csv.reader(handle)
+    first = next(reader, None)
+    if first is None:
+        return
+    if column is not None:
+        index = first.index(column)
+    elif any('@' in cell for cell in first):
+        index = next(i for i, cell in enumerate(first) if '@' in cell)
+        yield first[index].strip()
+    else:
+        index = first.index(find_email_column(first))
+    for row in reader:
+        if len(row) > index:
+            yield row[index].strip()
+        elif row:
+            yield ''
+
+def batched(items, size):
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def run_verify(args, parser):
+    from .scoring import score_results
+    from .verifier import PROVIDER_DEADLINE
+    
+    api_keys = api_keys_for(parser, args.providers)
+    verifier = build_verifier(args.providers, use_store=not args.no_cache)
+    deadline = args.deadline or PROVIDER_DEADLINE
+    columns = BASIC_COLUMNS + (list(flatten_provider_results({})) + ['verdict', 'confidence'] if api_keys else [])
+    
+    def check(email):
+        result = verifier.basic_verify(email)
+        row = {column: result[column] for column in BASIC_COLUMNS}
+        if api_keys:
+            provider_results = {}
+            if result['basic_status'] != 'Valid (Basic Check)':
+                consensus = score_results(result, provider_results)
+            elif args.all_providers:
+                provider_results = verifier.verify_all(email, api_keys, deadline=deadline)
+                consensus = score_results(result, provider_results)
+            else:
+                consensus, provider_results = verifier.verify_consensus(email, api_keys, result)
+            row.update(flatten_provider_results(provider_results))
+            row.update(verdict=consensus['verdict'], confidence=round(consensus['confidence'], 4))
+        return row
+    
+    source = sys.stdin if args.input == '-' else open(args.input, newline='', encoding='utf-8')
+    target = sys.stdout if args.output == '-' else open(args.output, 'w', newline='', encoding='utf-8')
+    try:
+        if args.format == 'csv':
+            writer = csv.DictWriter(target, fieldnames=columns)
+            writer.writeheader()
+            write = writer.writerow
+        else:
+            write = lambda row: target.write(json.dumps(row) + '\n')
+        
+        emails = read_emails(source, args.column)
+        if not api_keys:
+            for email in emails:
+                write(check(email))
+            return 0
+        
+        # Bounded batches keep memory flat while workers overlap provider latency
+        with ThreadPoolExecutor(max_workers=max(args.workers, 1)) as executor:
+            for batch in batched(emails, max(args.workers, 1) * 4):
+                for row in executor.map(check, batch):
+                    write(row)
+        return 0
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+
+def run_bulk(args, parser):
+    from .bulk import BULK_CHUNK_SIZE, run_bulk_verification
+    from .bulk_jobs import BULK_JOB_THRESHOLD
+    from .scoring import CONSENSUS_THRESHOLD
+    
+    api_keys = api_keys_for(parser, args.providers)
+    verifier = build_verifier(args.providers)
+    mx_resolver = smtp_prober = None
+    if args.mx_check or args.smtp_probe:
+        from .dns_check import MXResolver, SMTPProber
+        mx_resolver = MXResolver()
+        smtp_prober = SMTPProber() if args.smtp_probe else None
+    
+    def progress(rows, fraction):
+        print(f"\r{rows:,} rows ({fraction:.0%})", end='', file=sys.stderr, flush=True)
+    
+    options = dict(
+        api_keys=api_keys,
+        email_column=args.column,
+        output_format='parquet' if args.output.endswith('.parquet') else 'csv',
+        chunksize=args.chunk_size or BULK_CHUNK_SIZE,
+        on_progress=progress,
+        bulk_job_threshold=None if args.no_bulk_jobs else BULK_JOB_THRESHOLD,
+        consensus_threshold=None if args.all_providers else CONSENSUS_THRESHOLD,
+        paid_check_budget=args.max_paid_checks,
+        mx_resolver=mx_resolver,
+        smtp_prober=smtp_prober
+    )
+    if args.job_id:
+        from .jobs import JobJournal, run_job
+        summary = run_job(verifier, JobJournal(), args.job_id, args.input, args.output, **options)
+    else:
+        summary = run_bulk_verification(verifier, args.input, args.output, **options)
+    print(file=sys.stderr)
+    print(json.dumps(summary), file=sys.stderr)
+    return 0
+
+def run_batch(args, parser):
+    from .sharded import run_sharded_basic
+    
+    def progress(done, total):
+        print(f"\r{done}/{total} shards", end='', file=sys.stderr, flush=True)
+    
+    summary = run_sharded_basic(
+        args.input,
+        args.output,
+        workers=args.workers,
+        shards=args.shards,
+        email_column=args.column,
+        work_dir=args.work_dir,
+        on_progress=progress
+    )
+    print(file=sys.stderr)
+    print(json.dumps(summary), file=sys.stderr)
+    return 0
+
+def write_metrics(path):
+    from .metrics import METRICS
+    
+    with open(path, 'w', encoding='utf-8') as handle:
+        handle.write(METRICS.render_prometheus())
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == 'batch':
+        return run_batch(args, parser)
+    try:
+        if args.command == 'verify':
+            return run_verify(args, parser)
+        return run_bulk(args, parser)
+    finally:
+        if args.metrics:
+            write_metrics(args.metrics)
@@ -0,0 +1,87 @@
+"""Disposable-domain index loaded from external blocklists"""
+import json
+import os
+
+# External disposable-domain blocklists (one domain per line), separated by os.pathsep
+DISPOSABLE_DOMAIN_LISTS = [
+    path for path in os.environ.get('DISPOSABLE_DOMAIN_LISTS', 'disposable_domains.txt').split(os.pathsep) if path
+]
+# Compiled form of the blocklists, rebuilt only when a source file changes: a JSON
+# signature line, then the domains sorted one per line (plain data, nothing is executed)
+DISPOSABLE_INDEX_PATH = os.environ.get('DISPOSABLE_INDEX_PATH', 'disposable_domains.idx')
+
+# Disposable domains with parent-domain matching (x.mailinator.com matches mailinator.com)
+class DisposableDomainIndex:
+    def __init__(self, builtin=(), paths=(), index_path=DISPOSABLE_INDEX_PATH):
+        self.builtin = frozenset(builtin)
+        self.paths = list(paths)
+        self.index_path = index_path
+        self._signature = None
+        self._domains = self.builtin
+        self.reload()
+    
+    def _source_signature(self):
+        signature = []
+        for path in self.paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            signature.append((os.path.abspath(path), stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+    
+    @staticmethod
+    def _parse(path):
+        with open(path, encoding='utf-8', errors='ignore') as f:
+            for line in f:
+                domain = line.split('#', 1)[0].strip().lower().lstrip('*.').rstrip('.')
+                if domain:
+                    yield domain
+    
+    def _load_compiled(self, signature):
+        # A stale, foreign or damaged file just means a rebuild
+        try:
+            with open(self.index_path, encoding='utf-8') as f:
+                if f.readline().rstrip('\n') != json.dumps(signature):
+                    return None
+                return frozenset(filter(None, f.read().splitlines()))
+        except (OSError, ValueError):
+            return None
+    
+    def _write_compiled(self, signature, domains):
+        # Write then rename so concurrent processes never read a partial file
+        tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(signature) + '\n')
+                f.writelines(f"{domain}\n" for domain in sorted(domains))
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def reload(self, force=False):
+        """Pick up changed blocklist files; returns True if the index was rebuilt"""
+        signature = self._source_signature()
+        if not force and signature == self._signature:
+            return False
+        domains = None if force or not signature else self._load_compiled(signature)
+        if domains is None:
+            domains = frozenset(d for path, _, _ in signature for d in self._parse(path))
+            if signature:
+                self._write_compiled(signature, domains)
+        self._domains = domains | self.builtin
+        self._signature = signature
+        return True
+    
+    def __contains__(self, domain):
+        # Check the domain and each parent that still has two or more labels
+        domain = domain.lower().rstrip('.')
+        while '.' in domain:
+            if domain in self._domains:
+                return True
+            domain = domain.split('.', 1)[1]
+        return False
+    
+    def __len__(self):
+        return len(self._domains)
@@ -0,0 +1,216 @@
+"""Local MX lookup and SMTP mailbox probes"""
+import asyncio
+import os
+import smtplib
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import dns.asyncresolver
+import dns.exception
+import dns.name
+import dns.resolver
+
+# Local DNS settings; DNS_NAMESERVER ("host" or "host:port") overrides the system resolver
+DNS_NAMESERVER = os.environ.get('DNS_NAMESERVER', '')
+DNS_TIMEOUT = 5
+DNS_CONCURRENCY = 100
+DNS_MIN_TTL = 60
+DNS_MAX_TTL = 86400
+DNS_NEGATIVE_TTL = 300
+
+# Async MX lookups with a cache that honours record TTLs
+class MXResolver:
+    def __init__(self, nameserver=DNS_NAMESERVER, timeout=DNS_TIMEOUT, concurrency=DNS_CONCURRENCY):
+        self.nameserver = nameserver
+        self.timeout = timeout
+        self.concurrency = concurrency
+        self._cache = {}
+        self._lock = threading.Lock()
+    
+    def _resolver(self):
+        if not self.nameserver:
+            resolver = dns.asyncresolver.Resolver()
+        else:
+            host, _, port = self.nameserver.partition(':')
+            resolver = dns.asyncresolver.Resolver(configure=False)
+            resolver.nameservers = [host]
+            resolver.port = int(port or 53)
+        resolver.lifetime = self.timeout
+        return resolver
+    
+    def cached(self, domain):
+        """Return the cached lookup for a domain, or None if missing or expired"""
+        with self._lock:
+            entry = self._cache.get(domain)
+        if entry is None or entry[0] < time.time():
+            return None
+        return entry[1]
+    
+    def _store(self, domain, result, ttl):
+        ttl = min(max(ttl, DNS_MIN_TTL), DNS_MAX_TTL)
+        with self._lock:
+            self._cache[domain] = (time.time() + ttl, result)
+    
+    async def _query(self, resolver, domain):
+        # Names the format check lets through can still be unusable in DNS (b..com, 64+ octet labels)
+        try:
+            dns.name.from_text(domain)
+        except (dns.exception.SyntaxError, dns.exception.FormError) as e:
+            return {'has_mx': False, 'mx_hosts': [], 'reason': f'Invalid domain name: {e}'}, DNS_NEGATIVE_TTL
+        
+        try:
+            answer = await resolver.resolve(domain, 'MX')
+            hosts = sorted((r.preference, r.exchange.to_text(omit_final_dot=True)) for r in answer)
+            # A single "." exchange is a null MX: the domain accepts no mail (RFC 7505)
+            hosts = [(pref, host) for pref, host in hosts if host not in ('', '.')]
+            if not hosts:
+                return {'has_mx': False, 'mx_hosts': [], 'reason': 'Domain accepts no mail'}, answer.rrset.ttl
+            return {'has_mx': True, 'mx_hosts': [host for _, host in hosts]}, answer.rrset.ttl
+        except dns.resolver.NXDOMAIN:
+            return {'has_mx': False, 'mx_hosts': [], 'reason': 'Domain does not exist'}, DNS_NEGATIVE_TTL
+        except dns.resolver.NoAnswer:
+            pass
+        except dns.exception.DNSException as e:
+            return {'has_mx': None, 'mx_hosts': [], 'error': str(e) or type(e).__name__}, 0
+        
+        # No MX records: mail falls back to the domain's A record (RFC 5321 implicit MX)
+        try:
+            answer = await resolver.resolve(domain, 'A')
+            return {'has_mx': True, 'mx_hosts': [domain], 'implicit': True}, answer.rrset.ttl
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+            return {'has_mx': False, 'mx_hosts': [], 'reason': 'No MX or A records'}, DNS_NEGATIVE_TTL
+        except dns.exception.DNSException as e:
+            return {'has_mx': None, 'mx_hosts': [], 'error': str(e) or type(e).__name__}, 0
+    
+    async def lookup_many(self, domains):
+        """Resolve many domains concurrently; returns {domain: result}"""
+        results = {}
+        todo = []
+        for domain in set(domains):
+            cached = self.cached(domain)
+            if cached is not None:
+                results[domain] = cached
+            else:
+                todo.append(domain)
+        if not todo:
+            return results
+        
+        resolver = self._resolver()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        
+        async def lookup(domain):
+            async with semaphore:
+                result, ttl = await self._query(resolver, domain)
+            # Failed lookups are not cached so the next run retries them
+            if result['has_mx'] is not None:
+                self._store(domain, result, ttl)
+            results[domain] = result
+        
+        await asyncio.gather(*(lookup(domain) for domain in todo))
+        return results
+    
+    def resolve_many(self, domains):
+        """Blocking wrapper around lookup_many for synchronous callers"""
+        return asyncio.run(self.lookup_many(domains))
+
+# SMTP probe settings
+SMTP_PORT = 25
+SMTP_TIMEOUT = 10
+# Unset, the HELO name is this machine's FQDN and the sender verify@ that name, looked up
+# when a prober is created (getfqdn can block on DNS, so never at import)
+SMTP_HELO_HOST = os.environ.get('SMTP_HELO_HOST')
+SMTP_PROBE_SENDER = os.environ.get('SMTP_PROBE_SENDER')
+SMTP_MAX_RCPT_PER_SESSION = 50
+# MX hosts tried in preference order when the connection to one fails
+SMTP_MAX_MX_HOSTS = 3
+SMTP_WORKERS = 20
+
+# RCPT TO probes, reusing one SMTP session per domain
+class SMTPProber:
+    def __init__(self, port=SMTP_PORT, timeout=SMTP_TIMEOUT, helo_host=SMTP_HELO_HOST,
+                 sender=SMTP_PROBE_SENDER, workers=SMTP_WORKERS):
+        self.port = port
+        self.timeout = timeout
+        self.helo_host = helo_host or socket.getfqdn()
+        self.sender = sender or f'verify@{self.helo_host}'
+        self.workers = workers
+    
+    @staticmethod
+    def _classify(code):
+        if 200 <= code < 300:
+            return 'deliverable'
+        if code in (550, 551, 553):
+            return 'undeliverable'
+        return 'unknown'
+    
+    def _connect(self, mx_hosts):
+        """SMTP session with the first of mx_hosts that answers; raises the last failure"""
+        error = None
+        for mx_host in mx_hosts[:SMTP_MAX_MX_HOSTS]:
+            try:
+                return smtplib.SMTP(mx_host, self.port, local_hostname=self.helo_host, timeout=self.timeout)
+            except (OSError, smtplib.SMTPException) as e:
+                error = e
+        raise error
+    
+    def probe_domain(self, mx_hosts, emails):
+        """Probe one domain's addresses; returns ({email: result}, catch_all)
+        
+        mx_hosts is one host or a list in preference order; when a connection
+        fails the next host is tried.
+        """
+        results = {}
+        catch_all = None
+        try:
+            smtp = self._connect([mx_hosts] if isinstance(mx_hosts, str) else mx_hosts)
+        except (OSError, smtplib.SMTPException) as e:
+            return {email: {'status': 'unknown', 'error': str(e)} for email in emails}, None
+        
+        try:
+            for start in range(0, len(emails), SMTP_MAX_RCPT_PER_SESSION):
+                batch = emails[start:start + SMTP_MAX_RCPT_PER_SESSION]
+                smtp.ehlo_or_helo_if_needed()
+                smtp.mail(self.sender)
+                if catch_all is None:
+                    # An address that cannot exist being accepted means the server accepts everything
+                    domain = batch[0].split('@', 1)[1]
+                    code, _ = smtp.rcpt(f'{uuid.uuid4().hex}@{domain}')
+                    catch_all = self._classify(code) == 'deliverable'
+                for email in batch:
+                    code, message = smtp.rcpt(email)
+                    results[email] = {
+                        'status': self._classify(code),
+                        'code': code,
+                        'message': message.decode(errors='replace') if isinstance(message, bytes) else str(message)
+                    }
+                smtp.rset()
+        except (OSError, smtplib.SMTPException) as e:
+            for email in emails:
+                results.setdefault(email, {'status': 'unknown', 'error': str(e)})
+        finally:
+            try:
+                smtp.quit()
+            except (OSError, smtplib.SMTPException):
+                smtp.close()
+        return results, catch_all
+    
+    def probe_many(self, emails_by_domain, mx_hosts):
+        """Probe {domain: [email, ...]} in parallel; returns ({email: result}, {domain: catch_all})"""
+        results = {}
+        catch_all = {}
+        work = {d: emails for d, emails in emails_by_domain.items() if mx_hosts.get(d)}
+        if not work:
+            return results, catch_all
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(work))) as executor:
+            futures = {
+                executor.submit(self.probe_domain, mx_hosts[domain], emails): domain
+                for domain, emails in work.items()
+            }
+            for future in as_completed(futures):
+                domain_results, domain_catch_all = future.result()
+                results.update(domain_results)
+                catch_all[futures[future]] = domain_catch_all
+        return results, catch_all
@@ -0,0 +1,67 @@
+"""Cached API key health checks"""
+import hashlib
+import threading
+import time
+
+# Key health is re-checked after this many seconds
+KEY_HEALTH_TTL = 600
+
+# Caches API key status so the sidebar never probes the network while rendering
+class KeyHealthMonitor:
+    def __init__(self, probe, ttl=KEY_HEALTH_TTL):
+        self.probe = probe
+        self.ttl = ttl
+        self._status = {}
+        self._pending = set()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _fingerprint(api_key):
+        return hashlib.sha256(api_key.encode()).hexdigest()
+    
+    def check(self, provider, api_key):
+        """Probe a key now and store its status"""
+        fingerprint = self._fingerprint(api_key)
+        result = self.probe(provider, api_key)
+        status = {
+            'fingerprint': fingerprint,
+            'active': 'error' not in result,
+            'error': result.get('error'),
+            'credits': result.get('credits'),
+            'checked_at': time.time()
+        }
+        with self._lock:
+            self._status[provider] = status
+            self._pending.discard((provider, fingerprint))
+        return status
+    
+    def refresh_async(self, provider, api_key):
+        """Probe a key in a background thread unless a probe is already running"""
+        key = (provider, self._fingerprint(api_key))
+        with self._lock:
+            if key in self._pending:
+                return
+            self._pending.add(key)
+        
+        def run():
+            try:
+                self.check(provider, api_key)
+            finally:
+                with self._lock:
+                    self._pending.discard(key)
+        
+        threading.Thread(target=run, daemon=True).start()
+    
+    def status(self, provider, api_key, refresh=True):
+        """Return the cached status for this key, or None if it has not been checked
+        
+        Unknown or expired entries are refreshed in the background; an expired
+        status is still returned until the refresh completes.
+        """
+        with self._lock:
+            status = self._status.get(provider)
+        if status is not None and status['fingerprint'] != self._fingerprint(api_key):
+            status = None
+        if refresh and (status is None or time.time() - status['checked_at'] > self.ttl):
+            self.refresh_async(provider, api_key)
+        return status
@@ -0,0 +1,276 @@
+"""Resumable bulk verification jobs backed by a durable SQLite journal
+
+Each job writes one part file per chunk and records a checkpoint once the
+part is on disk. Provider results are journaled per address as they arrive,
+in batches written off the event loop.
+Running the same job ID again skips finished chunks and reuses journaled
+results, so a crash never re-spends credits on addresses already checked.
+"""
+import json
+import os
+import shutil
+import sqlite3
+import threading
+import time
+import uuid
+
+JOBS_DB_PATH = os.environ.get('EMAIL_VERIFIER_JOBS_DB', 'verification_jobs.db')
+
+# SQLite journal of jobs, chunk checkpoints and per-address provider results
+class JobJournal:
+    def __init__(self, path=JOBS_DB_PATH):
+        self.path = path
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id TEXT PRIMARY KEY,
+                    input_path TEXT NOT NULL,
+                    output_path TEXT NOT NULL,
+                    output_format TEXT NOT NULL,
+                    options TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    chunks_done INTEGER NOT NULL DEFAULT 0,
+                    progress REAL NOT NULL DEFAULT 0,
+                    summary TEXT NOT NULL DEFAULT '{}',
+                    error TEXT NOT NULL DEFAULT '',
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS job_results (
+                    job_id TEXT NOT NULL,
+                    email TEXT NOT NULL,
+                    results TEXT NOT NULL,
+                    PRIMARY KEY (job_id, email)
+                ) WITHOUT ROWID
+            """)
+    
+    def _connect(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS lookup_keys (email TEXT PRIMARY KEY)")
+            self._local.conn = conn
+        return conn
+    
+    @staticmethod
+    def _job_dict(row):
+        job = dict(row)
+        job['options'] = json.loads(job['options'])
+        job['summary'] = json.loads(job['summary'])
+        return job
+    
+    def create_job(self, job_id, input_path, output_path, output_format='csv', options=None):
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO jobs (job_id, input_path, output_path, output_format, options, status, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, 'pending', ?, ?)",
+                (job_id, input_path, output_path, output_format, json.dumps(options or {}), now, now)
+            )
+        return self.get_job(job_id)
+    
+    def get_job(self, job_id):
+        row = self._connect().execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return self._job_dict(row) if row else None
+    
+    def list_jobs(self, limit=50):
+        rows = self._connect().execute("SELECT * FROM jobs ORDER BY updated_at DESC LIMIT ?", (limit,)).fetchall()
+        return [self._job_dict(row) for row in rows]
+    
+    def set_status(self, job_id, status, error=''):
+        with self._connect() as conn:
+            conn.execute("UPDATE jobs SET status = ?, error = ?, updated_at = ? WHERE job_id = ?",
+                         (status, error, time.time(), job_id))
+    
+    def set_progress(self, job_id, progress):
+        with self._connect() as conn:
+            conn.execute("UPDATE jobs SET progress = ?, updated_at = ? WHERE job_id = ?",
+                         (progress, time.time(), job_id))
+    
+    def checkpoint(self, job_id, chunks_done, summary):
+        """Record that every chunk before chunks_done is safely on disk"""
+        with self._connect() as conn:
+            conn.execute("UPDATE jobs SET chunks_done = ?, summary = ?, updated_at = ? WHERE job_id = ?",
+                         (chunks_done, json.dumps(summary), time.time(), job_id))
+    
+    def get_results(self, job_id, emails):
+        """Journaled provider results for these addresses: {email: {provider: result}}"""
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM lookup_keys")
+            conn.executemany("INSERT OR IGNORE INTO lookup_keys (email) VALUES (?)", ((e,) for e in emails))
+            rows = conn.execute("""
+                SELECT r.email, r.results FROM job_results r
+                JOIN lookup_keys k ON r.email = k.email
+                WHERE r.job_id = ?
+            """, (job_id,)).fetchall()
+            conn.execute("DELETE FROM lookup_keys")
+        return {row['email']: json.loads(row['results']) for row in rows}
+    
+    def put_results(self, job_id, email, results):
+        self.put_results_many(job_id, [(email, results)])
+    
+    def put_results_many(self, job_id, items):
+        """Merge (email, {provider: result}) pairs into the journal in one transaction"""
+        merged = {}
+        for email, results in items:
+            if results:
+                merged.setdefault(email, {}).update(results)
+        if not merged:
+            return
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM lookup_keys")
+            conn.executemany("INSERT OR IGNORE INTO lookup_keys (email) VALUES (?)", ((e,) for e in merged))
+            rows = conn.execute("""
+                SELECT r.email, r.results FROM job_results r
+                JOIN lookup_keys k ON r.email = k.email
+                WHERE r.job_id = ?
+            """, (job_id,)).fetchall()
+            conn.execute("DELETE FROM lookup_keys")
+            for row in rows:
+                merged[row['email']] = dict(json.loads(row['results']), **merged[row['email']])
+            conn.executemany("INSERT OR REPLACE INTO job_results (job_id, email, results) VALUES (?, ?, ?)",
+                             ((job_id, email, json.dumps(results)) for email, results in merged.items()))
+    
+    def clear_results(self, job_id):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM job_results WHERE job_id = ?", (job_id,))
+
+# Adapts the journal to the get_many/put/put_many interface run_bulk_verification expects
+class _JobResults:
+    def __init__(self, journal, job_id):
+        self.journal = journal
+        self.job_id = job_id
+    
+    def get_many(self, emails):
+        return self.journal.get_results(self.job_id, emails)
+    
+    def put(self, email, results):
+        self.journal.put_results(self.job_id, email, results)
+    
+    def put_many(self, items):
+        self.journal.put_results_many(self.job_id, items)
+
+# Writes each chunk to its own part file so finished chunks survive a crash
+class PartWriter:
+    def __init__(self, parts_dir, output_format='csv', start_index=0):
+        self.parts_dir = parts_dir
+        self.output_format = output_format
+        self.index = start_index
+        os.makedirs(parts_dir, exist_ok=True)
+    
+    def part_path(self, index):
+        return os.path.join(self.parts_dir, f"part-{index:06d}.{self.output_format}")
+    
+    def write(self, table):
+        from .records import to_pandas
+        
+        path = self.part_path(self.index)
+        tmp_path = f"{path}.tmp"
+        if self.output_format == 'parquet':
+            import pyarrow.parquet as pq
+            pq.write_table(table, tmp_path)
+        else:
+            to_pandas(table).to_csv(tmp_path, index=False)
+        os.replace(tmp_path, path)
+        self.index += 1
+    
+    def close(self):
+        pass
+    
+    def merge(self, output_path, count):
+        """Concatenate parts 0..count-1 into output_path, one part in memory at a time"""
+        tmp_output = f"{output_path}.tmp"
+        if self.output_format == 'parquet':
+            import pyarrow.parquet as pq
+            writer = None
+            try:
+                for index in range(count):
+                    table = pq.read_table(self.part_path(index))
+                    if writer is None:
+                        writer = pq.ParquetWriter(tmp_output, table.schema)
+                    writer.write_table(table.cast(writer.schema))
+            finally:
+                if writer is not None:
+                    writer.close()
+        else:
+            with open(tmp_output, 'wb') as out:
+                for index in range(count):
+                    with open(self.part_path(index), 'rb') as part:
+                        header = part.readline()
+                        if index == 0:
+                            out.write(header)
+                        shutil.copyfileobj(part, out)
+        if count:
+            os.replace(tmp_output, output_path)
+
+def new_job_id():
+    return time.strftime('%Y%m%d-%H%M%S-') + uuid.uuid4().hex[:6]
+
+def run_job(verifier, journal, job_id, input_path=None, output_path=None, api_keys=None,
+            output_format='csv', on_progress=None, **options):
+    """Start or resume a bulk verification job
+    
+    A new job_id needs input_path and output_path; an existing one resumes
+    with the paths, format and options it was created with. API keys are
+    never journaled, so they are passed on every run. Extra options go to
+    run_bulk_verification (e.g. chunksize, bulk_job_threshold).
+    """
+    from .bulk import run_bulk_verification
+    
+    job = journal.get_job(job_id)
+    if job is None:
+        if not input_path or not output_path:
+            raise ValueError(f"Job {job_id} does not exist; input_path and output_path are required")
+        job = journal.create_job(job_id, input_path, output_path, output_format,
+                                 {k: v for k, v in options.items() if isinstance(v, (int, float, str, type(None)))})
+    elif job['status'] == 'completed':
+        return job['summary']
+    
+    stored_options = dict(job['options'])
+    stored_options.update({k: v for k, v in options.items() if k not in stored_options})
+    parts = PartWriter(f"{job['output_path']}.parts", job['output_format'], start_index=job['chunks_done'])
+    journal.set_status(job_id, 'running')
+    
+    def chunk_done(index, summary):
+        journal.checkpoint(job_id, index + 1, summary)
+    
+    def progress(rows, fraction):
+        journal.set_progress(job_id, fraction)
+        if on_progress is not None:
+            on_progress(rows, fraction)
+    
+    try:
+        summary = run_bulk_verification(
+            verifier,
+            job['input_path'],
+            job['output_path'],
+            api_keys=api_keys,
+            output_format=job['output_format'],
+            on_progress=progress,
+            writer=parts,
+            start_chunk=job['chunks_done'],
+            initial_summary=job['summary'],
+            journal=_JobResults(journal, job_id),
+            on_chunk_done=chunk_done,
+            **stored_options
+        )
+        parts.merge(job['output_path'], parts.index)
+    except BaseException as e:
+        journal.set_status(job_id, 'failed' if isinstance(e, Exception) else 'interrupted', str(e))
+        raise
+    
+    journal.checkpoint(job_id, parts.index, summary)
+    journal.set_progress(job_id, 1.0)
+    journal.set_status(job_id, 'completed')
+    journal.clear_results(job_id)
+    shutil.rmtree(parts.parts_dir, ignore_errors=True)
+    return summary
@@ -0,0 +1,152 @@
+"""Client-side rate limiting and credit tracking per provider"""
+import hashlib
+import threading
+import time
+
+# Client-side request rate per provider: (requests per second, burst size)
+PROVIDER_RATE_LIMITS = {
+    'hunter': (10, 10),
+    'neverbounce': (10, 20),
+    'zerobounce': (20, 40)
+}
+
+# Token bucket shared by every thread calling one provider
+class TokenBucket:
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _take(self):
+        """Take a token if one is available; returns 0, or the seconds until the next one"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0
+            return (1 - self._tokens) / self.rate
+    
+    def acquire(self, timeout=None):
+        """Block until a token is available; returns False if timeout passes first"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self._take()
+            if not wait:
+                return True
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+    
+    async def acquire_async(self, timeout=None):
+        """acquire() for coroutines: waits on the event loop instead of blocking the thread"""
+        import asyncio
+        
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self._take()
+            if not wait:
+                return True
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            await asyncio.sleep(wait)
+
+def build_rate_limiters(limits=None):
+    """Create one TokenBucket per provider"""
+    limits = dict(PROVIDER_RATE_LIMITS, **(limits or {}))
+    return {provider: TokenBucket(rate, burst) for provider, (rate, burst) in limits.items()}
+
+# Tracks provider credits so batches stop spending before the account runs dry.
+# Balances and budgets belong to one account: a provider plus the API key used with it.
+class CreditLedger:
+    def __init__(self):
+        self._remaining = {}
+        self._budgets = {}
+        self._spent = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _account(provider, api_key):
+        """Ledger key for a provider and API key; the key itself is never stored"""
+        return provider, hashlib.sha256(api_key.encode()).hexdigest() if api_key else None
+    
+    def set_remaining(self, provider, credits, api_key=None):
+        """Record the provider-reported credit balance"""
+        account = self._account(provider, api_key)
+        with self._lock:
+            self._remaining[account] = max(int(credits), 0)
+    
+    def set_budget(self, provider, credits, api_key=None):
+        """Cap how many paid checks may be spent from now on (None = no cap)"""
+        account = self._account(provider, api_key)
+        with self._lock:
+            self._budgets[account] = credits
+            self._spent[account] = 0
+    
+    def reserve(self, provider, api_key=None):
+        """Claim one credit before a paid call; False when the budget is exhausted"""
+        account = self._account(provider, api_key)
+        with self._lock:
+            remaining = self._remaining.get(account)
+            budget = self._budgets.get(account)
+            spent = self._spent.get(account, 0)
+            if remaining is not None and remaining <= 0:
+                return False
+            if budget is not None and spent >= budget:
+                return False
+            if remaining is not None:
+                self._remaining[account] = remaining - 1
+            self._spent[account] = spent + 1
+            return True
+    
+    def refund(self, provider, api_key=None):
+        """Give back a reserved credit for a call that failed"""
+        account = self._account(provider, api_key)
+        with self._lock:
+            if self._remaining.get(account) is not None:
+                self._remaining[account] += 1
+            self._spent[account] = max(self._spent.get(account, 0) - 1, 0)
+    
+    def update_from_result(self, provider, result, api_key=None):
+        """Sync with balances that providers report alongside results"""
+        credits = result.get('credits_info')
+        if credits:
+            self.set_remaining(provider, credits.get('free_credits_remaining', 0)
+                               + credits.get('paid_credits_remaining', 0), api_key)
+    
+    def has_credit(self, provider, api_key=None):
+        account = self._account(provider, api_key)
+        with self._lock:
+            remaining = self._remaining.get(account)
+            budget = self._budgets.get(account)
+            if remaining is not None and remaining <= 0:
+                return False
+            return budget is None or self._spent.get(account, 0) < budget
+    
+    def allowance(self, provider, api_key=None):
+        """How many more paid checks may run now, or None if unlimited"""
+        account = self._account(provider, api_key)
+        with self._lock:
+            limits = []
+            if self._remaining.get(account) is not None:
+                limits.append(self._remaining[account])
+            if self._budgets.get(account) is not None:
+                limits.append(self._budgets[account] - self._spent.get(account, 0))
+            return max(min(limits), 0) if limits else None
+    
+    def charge(self, provider, count, api_key=None):
+        """Record credits spent outside reserve(), e.g. by a bulk job"""
+        account = self._account(provider, api_key)
+        with self._lock:
+            if self._remaining.get(account) is not None:
+                self._remaining[account] = max(self._remaining[account] - count, 0)
+            self._spent[account] = self._spent.get(account, 0) + count
+    
+    def remaining(self, provider, api_key=None):
+        """Known credit balance, or None if the provider has not reported one"""
+        account = self._account(provider, api_key)
+        with self._lock:
+            return self._remaining.get(account)
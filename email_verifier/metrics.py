@@ -0,0 +1,231 @@
+"""In-process metrics: counters and latency histograms, rendered as Prometheus text"""
+import bisect
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Port for the optional Prometheus text endpoint (unset = no endpoint)
+METRICS_PORT = os.environ.get('EMAIL_VERIFIER_METRICS_PORT', '')
+
+# Help text for every metric; names are prefixed with email_verifier_ when rendered
+METRIC_HELP = {
+    'provider_request_seconds': ('histogram', 'Provider call latency, including retries'),
+    'provider_requests_total': ('counter', 'Provider calls by outcome (ok, api_error, timeout, exception)'),
+    'provider_retries_total': ('counter', 'HTTP retries by provider and reason'),
+    'provider_deadline_total': ('counter', 'Provider results abandoned at the fan-out deadline'),
+    'cache_lookups_total': ('counter', 'Result cache lookups by tier and outcome'),
+    'key_check_seconds': ('histogram', 'API key probe latency'),
+    'rerun_phase_seconds': ('histogram', 'Time per Streamlit rerun phase')
+}
+
+def _label_key(labels):
+    return tuple(sorted(labels.items()))
+
+def _escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+# Thread-safe registry shared by every verifier in the process
+class MetricsRegistry:
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._counters = {}
+        self._histograms = {}
+        self._lock = threading.Lock()
+    
+    def inc(self, name, amount=1, **labels):
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+    
+    def observe(self, name, seconds, **labels):
+        key = (name, _label_key(labels))
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = {'counts': [0] * (len(self.buckets) + 1), 'sum': 0.0, 'count': 0}
+            histogram['counts'][index] += 1
+            histogram['sum'] += seconds
+            histogram['count'] += 1
+    
+    @contextmanager
+    def timer(self, name, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+    
+    def counters(self, name):
+        """{sorted label pairs: value} for one counter"""
+        with self._lock:
+            return {labels: value for (n, labels), value in self._counters.items() if n == name}
+    
+    def histograms(self, name):
+        """{sorted label pairs: {'counts', 'sum', 'count'}} for one histogram"""
+        with self._lock:
+            return {labels: dict(h, counts=list(h['counts']))
+                    for (n, labels), h in self._histograms.items() if n == name}
+    
+    def quantile(self, histogram, q):
+        """Estimate a quantile from bucket counts, interpolating inside the bucket like Prometheus"""
+        if not histogram['count']:
+            return None
+        rank = q * histogram['count']
+        seen = 0
+        for index, count in enumerate(histogram['counts']):
+            if count and seen + count >= rank:
+                lower = self.buckets[index - 1] if index else 0.0
+                if index == len(self.buckets):
+                    return lower
+                return lower + (self.buckets[index] - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-1]
+    
+    def render_prometheus(self, prefix='email_verifier_'):
+        """All metrics in the Prometheus text exposition format"""
+        def labels_text(labels, extra=()):
+            pairs = list(labels) + list(extra)
+            if not pairs:
+                return ''
+            return '{' + ','.join(f'{k}="{_escape_label(v)}"' for k, v in pairs) + '}'
+        
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {key: dict(h, counts=list(h['counts'])) for key, h in self._histograms.items()}
+        lines = []
+        for name in sorted({n for n, _ in counters} | {n for n, _ in histograms}):
+            kind, help_text = METRIC_HELP.get(name, ('untyped', name))
+            lines.append(f"# HELP {prefix}{name} {help_text}")
+            lines.append(f"# TYPE {prefix}{name} {kind}")
+            for (n, labels), value in sorted(counters.items()):
+                if n == name:
+                    lines.append(f"{prefix}{name}{labels_text(labels)} {value}")
+            for (n, labels), histogram in sorted(histograms.items()):
+                if n != name:
+                    continue
+                cumulative = 0
+                for bound, count in zip(self.buckets + (float('inf'),), histogram['counts']):
+                    cumulative += count
+                    le = '+Inf' if bound == float('inf') else repr(bound)
+                    lines.append(f"{prefix}{name}_bucket{labels_text(labels, [('le', le)])} {cumulative}")
+                lines.append(f"{prefix}{name}_sum{labels_text(labels)} {histogram['sum']:.6f}")
+                lines.append(f"{prefix}{name}_count{labels_text(labels)} {histogram['count']}")
+        return '\n'.join(lines) + '\n'
+    
+    def summary(self):
+        """Rows for a diagnostics view: per-provider calls and latency, cache hit ratio per tier"""
+        calls = {}
+        
+        def provider_row(labels):
+            provider = dict(labels)['provider']
+            return calls.setdefault(provider, {'provider': provider, 'calls': 0, 'ok': 0, 'api_error': 0,
+                                               'timeout': 0, 'exception': 0, 'retries': 0, 'deadline': 0})
+        
+        for labels, value in self.counters('provider_requests_total').items():
+            provider_row(labels)[dict(labels)['outcome']] += value
+        for labels, value in self.counters('provider_retries_total').items():
+            provider_row(labels)['retries'] += value
+        for labels, value in self.counters('provider_deadline_total').items():
+            provider_row(labels)['deadline'] += value
+        for labels, histogram in self.histograms('provider_request_seconds').items():
+            row = provider_row(labels)
+            row['calls'] = histogram['count']
+            row['mean_ms'] = histogram['sum'] / histogram['count'] * 1000
+            row['p50_ms'] = self.quantile(histogram, 0.5) * 1000
+            row['p95_ms'] = self.quantile(histogram, 0.95) * 1000
+        
+        tiers = {}
+        for labels, value in self.counters('cache_lookups_total').items():
+            labels = dict(labels)
+            row = tiers.setdefault(labels['tier'], {'tier': labels['tier'], 'hit': 0, 'miss': 0})
+            row[labels['outcome']] += value
+        for row in tiers.values():
+            row['hit_ratio'] = row['hit'] / (row['hit'] + row['miss']) if row['hit'] + row['miss'] else None
+        
+        timers = []
+        for name in ('rerun_phase_seconds', 'key_check_seconds'):
+            for labels, histogram in sorted(self.histograms(name).items()):
+                timers.append({
+                    'timer': name.replace('_seconds', ''),
+                    'label': ','.join(str(v) for _, v in labels),
+                    'count': histogram['count'],
+                    'mean_ms': histogram['sum'] / histogram['count'] * 1000,
+                    'p95_ms': self.quantile(histogram, 0.95) * 1000
+                })
+        return {
+            'providers': [calls[p] for p in sorted(calls)],
+            'cache': [tiers[t] for t in sorted(tiers)],
+            'timers': timers
+        }
+    
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+METRICS = MetricsRegistry()
+
+def classify_result(result):
+    """Outcome label for a provider result dict"""
+    if 'error' not in result:
+        return 'ok'
+    error_type = result.get('error_type', '')
+    if 'Timeout' in error_type or result.get('timed_out'):
+        return 'timeout'
+    if error_type:
+        return 'exception'
+    return 'api_error'
+
+def record_provider_call(provider, result, seconds, registry=METRICS):
+    registry.observe('provider_request_seconds', seconds, provider=provider)
+    registry.inc('provider_requests_total', provider=provider, outcome=classify_result(result))
+
+def record_cache_lookup(provider, tier, hit, registry=METRICS):
+    registry.inc('cache_lookups_total', provider=provider, tier=tier, outcome='hit' if hit else 'miss')
+
+# Phase timings for one Streamlit rerun: call lap(phase) as each phase ends
+class RerunTimer:
+    def __init__(self, registry=METRICS):
+        self.registry = registry
+        self.started = self._last = time.perf_counter()
+        self.phases = {}
+    
+    def lap(self, phase):
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + now - self._last
+        self.registry.observe('rerun_phase_seconds', now - self._last, phase=phase)
+        self._last = now
+    
+    def finish(self):
+        """Record the whole rerun and return {phase: seconds}"""
+        total = time.perf_counter() - self.started
+        self.registry.observe('rerun_phase_seconds', total, phase='total')
+        return dict(self.phases, total=total)
+
+def start_metrics_server(port, registry=METRICS, host='0.0.0.0'):
+    """Serve registry.render_prometheus() at /metrics on a daemon thread"""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] != '/metrics':
+                self.send_error(404)
+                return
+            body = registry.render_prometheus().encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def log_message(self, format, *args):
+            pass
+    
+    server = ThreadingHTTPServer((host, int(port)), MetricsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -0,0 +1,82 @@
+"""Provider clients: one request/response mapping per API, shared by the sync and async paths"""
+from .results import normalize_neverbounce, normalize_zerobounce
+
+# Common interface: build the request, map the response, run it on either transport
+class ProviderClient:
+    name = None
+    path = None
+    
+    def params(self, email, api_key):
+        raise NotImplementedError
+    
+    def parse(self, status_code, data):
+        """Map an HTTP status and decoded body to a result dict ({'error': ...} on failure)"""
+        raise NotImplementedError
+    
+    def verify(self, transport, email, api_key):
+        """Verify one address over a ProviderTransport"""
+        try:
+            return self.parse(*transport.get_json(self.path, self.params(email, api_key)))
+        except Exception as e:
+            return {'error': str(e), 'error_type': type(e).__name__}
+    
+    async def verify_async(self, transport, email, api_key):
+        """Verify one address over an AsyncProviderTransport"""
+        try:
+            return self.parse(*await transport.get_json(self.path, self.params(email, api_key)))
+        except Exception as e:
+            return {'error': str(e), 'error_type': type(e).__name__}
+
+class HunterClient(ProviderClient):
+    name = 'hunter'
+    path = '/v2/email-verifier'
+    
+    def params(self, email, api_key):
+        return {'email': email, 'api_key': api_key}
+    
+    def parse(self, status_code, data):
+        if status_code != 200:
+            return {'error': data.get('errors', [{}])[0].get('details', 'API error')}
+        result = data.get('data', {})
+        return {
+            'score': result.get('score', 0),
+            'status': result.get('result', 'unknown'),
+            'sources': result.get('sources', 0),
+            'regexp': result.get('regexp', False),
+            'gibberish': result.get('gibberish', False),
+            'disposable': result.get('disposable', False),
+            'webmail': result.get('webmail', False),
+            'mx_records': result.get('mx_records', False),
+            'smtp_server': result.get('smtp_server', False),
+            'smtp_check': result.get('smtp_check', False),
+            'accept_all': result.get('accept_all', False),
+            'block': result.get('block', False)
+        }
+
+class NeverBounceClient(ProviderClient):
+    name = 'neverbounce'
+    path = '/v4/single/check'
+    
+    def params(self, email, api_key):
+        return {'key': api_key, 'email': email}
+    
+    def parse(self, status_code, data):
+        # Auth failures and throttling arrive as HTTP 200 with a non-success status
+        if status_code != 200 or data.get('status') != 'success':
+            return {'error': data.get('message') or data.get('status') or 'API error'}
+        return normalize_neverbounce(data)
+
+class ZeroBounceClient(ProviderClient):
+    name = 'zerobounce'
+    path = '/v2/validate'
+    
+    def params(self, email, api_key):
+        return {'api_key': api_key, 'email': email}
+    
+    def parse(self, status_code, data):
+        # Invalid keys and exhausted credits arrive as HTTP 200 with an error field
+        if status_code != 200 or 'error' in data:
+            return {'error': data.get('error') or 'API error'}
+        return normalize_zerobounce(data)
+
+PROVIDER_CLIENTS = {client.name: client for client in (HunterClient(), NeverBounceClient(), ZeroBounceClient())}
@@ -0,0 +1,44 @@
+"""Typed Arrow schema for verification results written by bulk runs and jobs (requires pyarrow)"""
+import pyarrow as pa
+
+# Status-like text is dictionary encoded: a small integer per row, each distinct value stored once
+CODED_TEXT = pa.dictionary(pa.int32(), pa.string())
+
+# Every bulk output chunk has exactly this schema, so Parquet row groups always line up
+RESULT_SCHEMA = pa.schema([
+    ('email', pa.string()),
+    ('basic_format', pa.bool_()),
+    ('basic_disposable', pa.bool_()),
+    ('basic_status', CODED_TEXT),
+    ('basic_suggestion', pa.string()),
+    ('hunter_status', CODED_TEXT),
+    ('hunter_score', pa.float64()),
+    ('hunter_error', CODED_TEXT),
+    ('neverbounce_result', CODED_TEXT),
+    ('neverbounce_error', CODED_TEXT),
+    ('zerobounce_status', CODED_TEXT),
+    ('zerobounce_sub_status', CODED_TEXT),
+    ('zerobounce_error', CODED_TEXT),
+    ('provider_skipped', CODED_TEXT),
+    ('smtp_status', CODED_TEXT),
+    ('domain_mx', pa.bool_()),
+    ('domain_catch_all', pa.bool_()),
+    ('verdict', CODED_TEXT),
+    ('confidence', pa.float64())
+])
+
+def result_table(columns):
+    """Build a RESULT_SCHEMA table from {column: list or pandas Series}
+    
+    NaN and None become nulls; every schema column must be present.
+    """
+    arrays = [pa.array(columns[field.name], type=field.type, from_pandas=True) for field in RESULT_SCHEMA]
+    return pa.Table.from_arrays(arrays, schema=RESULT_SCHEMA)
+
+def to_pandas(table):
+    """Hand a result table to pandas, reusing Arrow buffers where the types allow
+    
+    Coded text arrives as categorical columns. The table is consumed and
+    must not be used afterwards.
+    """
+    return table.to_pandas(split_blocks=True, self_destruct=True)
@@ -0,0 +1,79 @@
+"""Normalized result schema shared by every provider path"""
+
+def normalize_email(email):
+    """Canonical form used for cache keys"""
+    return email.strip().lower()
+
+def normalize_neverbounce(data):
+    """Map a NeverBounce single-check response to the app's result schema"""
+    return {
+        'result': data.get('result', 'unknown'),
+        'result_code': data.get('result_code', ''),
+        'flags': data.get('flags', []),
+        'suggested_correction': data.get('suggested_correction', ''),
+        'credits_info': data.get('credits_info', {})
+    }
+
+def normalize_zerobounce(data):
+    """Map a ZeroBounce validate response to the app's result schema"""
+    return {
+        'status': data.get('status', 'unknown'),
+        'sub_status': data.get('sub_status', ''),
+        'account': data.get('account', ''),
+        'domain': data.get('domain', ''),
+        'did_you_mean': data.get('did_you_mean', ''),
+        'domain_age_days': data.get('domain_age_days', ''),
+        'smtp_provider': data.get('smtp_provider', ''),
+        'mx_found': data.get('mx_found', ''),
+        'mx_record': data.get('mx_record', ''),
+        'firstname': data.get('firstname', ''),
+        'lastname': data.get('lastname', ''),
+        'gender': data.get('gender', ''),
+        'country': data.get('country', ''),
+        'region': data.get('region', ''),
+        'city': data.get('city', ''),
+        'zipcode': data.get('zipcode', ''),
+        'processed_at': data.get('processed_at', '')
+    }
+
+# Flat output columns taken from provider results: (column, provider, field, default)
+PROVIDER_FIELDS = (
+    ('hunter_status', 'hunter', 'status', ''),
+    ('hunter_score', 'hunter', 'score', None),
+    ('hunter_error', 'hunter', 'error', ''),
+    ('neverbounce_result', 'neverbounce', 'result', ''),
+    ('neverbounce_error', 'neverbounce', 'error', ''),
+    ('zerobounce_status', 'zerobounce', 'status', ''),
+    ('zerobounce_sub_status', 'zerobounce', 'sub_status', ''),
+    ('zerobounce_error', 'zerobounce', 'error', '')
+)
+
+_NO_RESULT = {}
+
+def flatten_provider_results(provider_results):
+    """Turn one email's provider results into flat columns for CSV/Parquet output"""
+    return {
+        column: provider_results.get(provider, _NO_RESULT).get(field, default)
+        for column, provider, field, default in PROVIDER_FIELDS
+    }
+
+# Column-wise buffer of flattened provider results; no dict is kept per row
+class ProviderColumns:
+    __slots__ = ('columns',)
+    
+    def __init__(self):
+        self.columns = {column: [] for column, _, _, _ in PROVIDER_FIELDS}
+    
+    def append(self, provider_results):
+        for column, provider, field, default in PROVIDER_FIELDS:
+            self.columns[column].append(provider_results.get(provider, _NO_RESULT).get(field, default))
+    
+    def __len__(self):
+        return len(self.columns['hunter_status'])
+
+def find_email_column(columns):
+    """Pick the column that most likely holds email addresses"""
+    for column in columns:
+        if 'email' in str(column).lower():
+            return column
+    return columns[0]
@@ -0,0 +1,126 @@
+"""Consensus verdict across the basic check and provider results"""
+import math
+
+# Approximate pay-as-you-go price per check (USD); consensus checks call the cheapest first
+PROVIDER_COSTS = {
+    'neverbounce': 0.008,
+    'zerobounce': 0.009,
+    'hunter': 0.034
+}
+
+# Stop calling providers once the verdict is at least this certain
+CONSENSUS_THRESHOLD = 0.95
+
+# Deliverability probability above which an address is "use" and below which it is "avoid"
+USE_ABOVE = 0.85
+AVOID_BELOW = 0.15
+
+# Starting log-odds for an address that passed the basic check, and for one whose domain
+# looks like a typo (still short of the consensus threshold, so providers are asked)
+BASIC_VALID_LOG_ODDS = 1.0
+TYPO_LOG_ODDS = -1.0
+
+# Log-odds each provider answer adds; answers not listed add nothing
+HUNTER_EVIDENCE = {'deliverable': 3.0, 'undeliverable': -4.0}
+# (catch-all servers accept everything, so those answers lean slightly towards risky)
+NEVERBOUNCE_EVIDENCE = {'valid': 4.0, 'invalid': -5.0, 'catchall': -0.5}
+ZEROBOUNCE_EVIDENCE = {'valid': 4.0, 'invalid': -5.0, 'catch-all': -0.5, 'abuse': -2.0, 'do_not_mail': -3.0}
+# Log-odds for a domain already known to accept every address
+CATCH_ALL_EVIDENCE = -0.5
+
+def provider_evidence(provider, result):
+    """Return (log-odds, reason) for one provider answer
+    
+    log-odds is None when the answer settles the verdict as "avoid" on its
+    own (disposable addresses, spam traps, domains without mail servers and
+    mailboxes the SMTP server rejected). Domain facts report as 'dns'
+    ({'has_mx', 'catch_all'}) and SMTP probes as 'smtp'.
+    """
+    if provider == 'hunter':
+        status = result.get('status', 'unknown')
+        if result.get('disposable'):
+            return None, 'Hunter.io: disposable'
+        if status == 'risky':
+            # Hunter's own score separates likely from unlikely risky addresses
+            return (result.get('score', 50) - 50) / 25, f"Hunter.io: risky (score {result.get('score', 0)})"
+        return HUNTER_EVIDENCE.get(status, 0.0), f"Hunter.io: {status}"
+    if provider == 'neverbounce':
+        status = result.get('result', 'unknown')
+        if status == 'disposable':
+            return None, 'NeverBounce: disposable'
+        return NEVERBOUNCE_EVIDENCE.get(status, 0.0), f"NeverBounce: {status}"
+    if provider == 'zerobounce':
+        status = result.get('status', 'unknown')
+        if status == 'spamtrap' or result.get('sub_status') == 'disposable':
+            return None, f"ZeroBounce: {result.get('sub_status') or status}"
+        return ZEROBOUNCE_EVIDENCE.get(status, 0.0), f"ZeroBounce: {status}"
+    if provider == 'dns':
+        if result.get('has_mx') is False:
+            return None, 'No MX records'
+        if result.get('catch_all'):
+            return CATCH_ALL_EVIDENCE, 'Catch-all domain'
+        return 0.0, 'DNS: MX found'
+    if provider == 'smtp':
+        status = result.get('status', 'unknown')
+        if status == 'undeliverable':
+            return None, 'Rejected by SMTP server'
+        return 0.0, f"SMTP: {status}"
+    return 0.0, f"{provider}: ignored"
+
+def _verdict(probability, reasons, sources):
+    if probability >= USE_ABOVE:
+        verdict = 'use'
+    elif probability <= AVOID_BELOW:
+        verdict = 'avoid'
+    else:
+        verdict = 'risky'
+    return {
+        'verdict': verdict,
+        'probability': probability,
+        'confidence': max(probability, 1 - probability),
+        'reasons': reasons,
+        'sources': sources
+    }
+
+def score_results(basic_result, provider_results):
+    """Combine the basic check and provider results into one verdict
+    
+    Each answer shifts the log-odds that the address is deliverable, so
+    agreeing providers reinforce each other and a catch-all or unknown answer
+    leaves the verdict uncertain. Errors and missing providers add nothing. A
+    suspected domain typo starts below even odds, so the verdict stays risky
+    until providers confirm or reject the address. With no provider answer at
+    all the verdict is the basic check's own: "use" for a clean pass.
+    """
+    if not basic_result['basic_format']:
+        return _verdict(0.0, ['Invalid format'], ['basic'])
+    if basic_result['basic_disposable']:
+        return _verdict(0.0, ['Disposable domain'], ['basic'])
+    
+    log_odds = BASIC_VALID_LOG_ODDS
+    reasons = ['Valid format']
+    if basic_result.get('basic_suggestion'):
+        log_odds = TYPO_LOG_ODDS
+        reasons = [f"Possible typo of {basic_result['basic_suggestion']}"]
+    sources = ['basic']
+    for provider, result in provider_results.items():
+        if not result or 'error' in result:
+            continue
+        evidence, reason = provider_evidence(provider, result)
+        if evidence is None:
+            return _verdict(0.0, [reason], sources + [provider])
+        log_odds += evidence
+        reasons.append(reason)
+        sources.append(provider)
+    result = _verdict(1 / (1 + math.exp(-log_odds)), reasons, sources)
+    if sources == ['basic']:
+        # Nothing to weigh against the basic check; the probability still tells consensus
+        # checks that providers are worth asking
+        result['verdict'] = 'use' if log_odds > 0 else 'risky'
+    return result
+
+def provider_order(providers, is_cached=None, costs=None):
+    """Providers to consult, already-cached answers first, then cheapest first"""
+    costs = dict(PROVIDER_COSTS, **(costs or {}))
+    is_cached = is_cached or (lambda provider: False)
+    return sorted(providers, key=lambda p: (not is_cached(p), costs.get(p, math.inf)))
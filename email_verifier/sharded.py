@@ -0,0 +1,181 @@
+"""Multi-process, resumable basic verification of large CSV files
+
+The input is split into byte ranges aligned to line boundaries. Each shard is
+verified in its own process and written to a shard file in a basic-shards
+subdirectory of the work directory, with a marker file once it is complete.
+Rerunning with the same input skips finished shards, and the shard files are
+concatenated in order at the end.
+Quoted fields containing newlines are not supported by byte-range splitting.
+"""
+import csv
+import glob
+import io
+import json
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .results import find_email_column
+
+# Shards per worker; more shards balance uneven rows and lose less work on a crash
+SHARDS_PER_WORKER = 4
+SHARD_READ_SIZE = 1 << 20
+
+# Subdirectory of the work dir that holds the shard files; nothing else in the work dir is touched
+SHARD_DIR_NAME = 'basic-shards'
+
+def _shard_paths(shard_dir, index):
+    base = os.path.join(shard_dir, f"shard-{index:05d}")
+    return f"{base}.csv", f"{base}.done"
+
+def _remove_shard_files(shard_dir):
+    """Delete the shard, marker and manifest files this runner writes, then the directory if empty"""
+    for path in glob.glob(os.path.join(shard_dir, 'shard-*')) + [os.path.join(shard_dir, 'manifest.json')]:
+        if os.path.exists(path):
+            os.remove(path)
+    try:
+        os.rmdir(shard_dir)
+    except OSError:
+        pass
+
+def _plan_shards(path, data_start, shards):
+    """Split [data_start, size) into roughly equal byte ranges"""
+    size = os.path.getsize(path)
+    span = max(size - data_start, 0)
+    shards = max(1, min(shards, span // SHARD_READ_SIZE + 1))
+    bounds = [data_start + span * i // shards for i in range(shards + 1)]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+def _read_range(path, start, end, data_start):
+    """Return the complete lines that begin inside [start, end)"""
+    with open(path, 'rb') as f:
+        f.seek(start)
+        if start > data_start:
+            # The line straddling the boundary belongs to the previous shard
+            f.seek(start - 1)
+            f.readline()
+        begin = f.tell()
+        if begin >= end:
+            return b''
+        data = f.read(end - begin)
+        if not data.endswith(b'\n'):
+            data += f.readline()
+        return data
+
+def _verify_shard(task):
+    """Worker: basic-verify one byte range and write it to a shard file"""
+    from .verifier import ProEmailVerifier
+    import pandas as pd
+    
+    index, path, start, end, data_start, column_index, shard_dir = task
+    output, marker = _shard_paths(shard_dir, index)
+    
+    data = _read_range(path, start, end, data_start)
+    emails = [
+        row[column_index].strip() if len(row) > column_index else ''
+        for row in csv.reader(io.StringIO(data.decode('utf-8', errors='replace')))
+        if row
+    ]
+    verifier = ProEmailVerifier()
+    result = verifier.basic_verify_many(pd.Series(emails, dtype=object))
+    
+    # Write under a temporary name so a crash never leaves a half shard behind
+    tmp_output = f"{output}.tmp"
+    result.to_csv(tmp_output, index=False, header=False, lineterminator='\n')
+    os.replace(tmp_output, output)
+    counts = result['basic_status'].value_counts().to_dict()
+    with open(f"{marker}.tmp", 'w') as f:
+        json.dump({'rows': len(result), 'status_counts': counts}, f)
+    os.replace(f"{marker}.tmp", marker)
+    return index, len(result), counts
+
+def _load_manifest(shard_dir):
+    try:
+        with open(os.path.join(shard_dir, 'manifest.json')) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def run_sharded_basic(input_path, output_path, workers=None, shards=None, email_column=None,
+                      work_dir=None, on_progress=None):
+    """Basic-verify a CSV across a process pool, resuming finished shards
+    
+    on_progress(shards_done, shards_total) is called as shards complete.
+    Returns a summary with row and status counts.
+    """
+    workers = workers or os.cpu_count() or 1
+    default_work_dir = f"{output_path}.shards"
+    shard_dir = os.path.join(work_dir or default_work_dir, SHARD_DIR_NAME)
+    
+    with open(input_path, 'rb') as f:
+        header_line = f.readline()
+    header = next(csv.reader([header_line.decode('utf-8', errors='replace')]), [])
+    if not header:
+        raise ValueError(f"{input_path} is empty")
+    column = email_column or find_email_column(header)
+    column_index = header.index(column)
+    
+    stat = os.stat(input_path)
+    ranges = _plan_shards(input_path, len(header_line), shards or workers * SHARDS_PER_WORKER)
+    manifest = {
+        'input': os.path.abspath(input_path),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'column': column,
+        'ranges': ranges
+    }
+    # A work dir from a different input or shard layout cannot be resumed
+    previous = _load_manifest(shard_dir)
+    if previous is not None and previous != json.loads(json.dumps(manifest)):
+        _remove_shard_files(shard_dir)
+    os.makedirs(shard_dir, exist_ok=True)
+    with open(os.path.join(shard_dir, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f)
+    
+    summary = {'rows': 0, 'shards': len(ranges), 'shards_resumed': 0, 'status_counts': {},
+               'output_path': output_path}
+    
+    def record(rows, counts):
+        summary['rows'] += rows
+        for status, count in counts.items():
+            summary['status_counts'][status] = summary['status_counts'].get(status, 0) + count
+    
+    pending = []
+    for index, (start, end) in enumerate(ranges):
+        output, marker = _shard_paths(shard_dir, index)
+        if os.path.exists(marker) and os.path.exists(output):
+            with open(marker) as f:
+                done = json.load(f)
+            record(done['rows'], done['status_counts'])
+            summary['shards_resumed'] += 1
+        else:
+            pending.append((index, input_path, start, end, len(header_line), column_index, shard_dir))
+    
+    completed = summary['shards_resumed']
+    if on_progress is not None:
+        on_progress(completed, len(ranges))
+    if pending:
+        with ProcessPoolExecutor(max_workers=min(workers, len(pending))) as executor:
+            for future in as_completed([executor.submit(_verify_shard, task) for task in pending]):
+                _, rows, counts = future.result()
+                record(rows, counts)
+                completed += 1
+                if on_progress is not None:
+                    on_progress(completed, len(ranges))
+    
+    # Concatenate shard files in input order
+    tmp_output = f"{output_path}.tmp"
+    with open(tmp_output, 'w', newline='', encoding='utf-8') as out:
+        csv.writer(out, lineterminator='\n').writerow(['email', 'basic_format', 'basic_disposable', 'basic_status', 'basic_suggestion'])
+    with open(tmp_output, 'ab') as out:
+        for index in range(len(ranges)):
+            with open(_shard_paths(shard_dir, index)[0], 'rb') as shard:
+                shutil.copyfileobj(shard, out)
+    os.replace(tmp_output, output_path)
+    _remove_shard_files(shard_dir)
+    if not work_dir:
+        try:
+            os.rmdir(default_work_dir)
+        except OSError:
+            pass
+    return summary
@@ -0,0 +1,219 @@
+"""Local typo suggestions for mistyped mailbox provider domains (gmial.com -> gmail.com)"""
+import threading
+from collections import OrderedDict
+
+# Popular mailbox domains, most common first; ties in edit distance go to the earlier one
+POPULAR_DOMAINS = (
+    'gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com', 'icloud.com', 'aol.com',
+    'live.com', 'msn.com', 'googlemail.com', 'me.com', 'mac.com', 'ymail.com', 'rocketmail.com',
+    'protonmail.com', 'proton.me', 'pm.me', 'gmx.com', 'gmx.net', 'gmx.de', 'mail.com',
+    'yandex.com', 'yandex.ru', 'mail.ru', 'zoho.com', 'fastmail.com', 'tutanota.com',
+    'comcast.net', 'verizon.net', 'att.net', 'sbcglobal.net', 'bellsouth.net', 'cox.net',
+    'charter.net', 'earthlink.net', 'hotmail.co.uk', 'yahoo.co.uk', 'live.co.uk', 'btinternet.com',
+    'hotmail.fr', 'yahoo.fr', 'orange.fr', 'wanadoo.fr', 'free.fr', 'laposte.net',
+    'web.de', 't-online.de', 'libero.it', 'virgilio.it', 'yahoo.it', 'hotmail.it',
+    'hotmail.es', 'yahoo.es', 'yahoo.com.br', 'uol.com.br', 'bol.com.br', 'terra.com.br',
+    'yahoo.in', 'rediffmail.com', 'qq.com', '163.com', '126.com', 'naver.com', 'daum.net',
+    'shaw.ca', 'rogers.com', 'sympatico.ca', 'bigpond.com', 'optusnet.com.au'
+)
+
+# Real mail domains within a few edits of a popular one; these are never suggested a correction
+KNOWN_DOMAINS = (
+    'email.com', 'olive.com', 'inbox.com', 'mail.de', 'web.com',
+    'aon.com', 'uol.com', 'bol.com', 'att.com', 'box.net', 'fox.net', 'line.com', 'love.com',
+    'zoo.com', 'mac.org', 'me.org'
+)
+
+# Regional domains of popular providers; a popular name under any other suffix (gmail.co,
+# hotmail.cm) is treated as a mistyped suffix
+REGIONAL_DOMAINS = (
+    'yahoo.co.jp', 'yahoo.de', 'yahoo.ca', 'yahoo.co.in', 'yahoo.co.id', 'yahoo.com.au',
+    'yahoo.com.mx', 'yahoo.com.ar', 'yahoo.com.sg', 'yahoo.com.ph', 'yahoo.com.tw', 'yahoo.com.hk',
+    'yahoo.gr', 'yahoo.se', 'yahoo.dk', 'yahoo.no', 'yahoo.ie', 'yahoo.pl', 'yahoo.ro', 'yahoo.co.nz',
+    'hotmail.de', 'hotmail.co.jp', 'hotmail.ca', 'hotmail.nl', 'hotmail.be', 'hotmail.se', 'hotmail.dk',
+    'hotmail.no', 'hotmail.ch', 'hotmail.gr', 'hotmail.com.br', 'hotmail.com.ar', 'hotmail.com.au',
+    'hotmail.com.mx', 'hotmail.com.tr', 'live.de', 'live.fr', 'live.nl', 'live.it', 'live.ca',
+    'live.be', 'live.se', 'live.dk', 'live.no', 'live.jp', 'live.com.au', 'live.com.mx', 'live.com.ar',
+    'outlook.de', 'outlook.fr', 'outlook.es', 'outlook.it', 'outlook.jp', 'outlook.be', 'outlook.com.br',
+    'outlook.com.au', 'outlook.co.uk', 'aol.de', 'aol.fr', 'aol.co.uk', 'gmx.at', 'gmx.ch', 'gmx.fr',
+    'gmx.us', 'gmx.co.uk', 'gmx.es', 'gmx.it', 'yandex.ua', 'yandex.by', 'yandex.kz', 'zoho.eu',
+    'zoho.in', 'protonmail.ch'
+)
+
+# Largest edit distance suggested; domains shorter than LONG_DOMAIN_LENGTH allow only one edit
+SUGGESTION_MAX_DISTANCE = 2
+LONG_DOMAIN_LENGTH = 10
+# Names shorter than this sit one edit away from many real domains (aon/aol, box/cox),
+# so for those only a misspelt suffix is corrected
+SHORT_NAME_LENGTH = 5
+
+# Distinct domains remembered between lookups; the least recently used are dropped first
+SUGGESTION_CACHE_SIZE = 100000
+
+def _deletes(word, depth):
+    """word with up to depth characters removed, including word itself"""
+    found = {word}
+    frontier = {word}
+    for _ in range(depth):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))} - found
+        found |= frontier
+    return found
+
+# Bit per character for the vectorized prefilter; anything else shares the last bit
+_MASK_ALPHABET = 'abcdefghijklmnopqrstuvwxyz0123456789.-'
+
+def _char_mask(word):
+    """Bitmask of the characters in word, used to rule out far-off domains before any deletes"""
+    mask = 0
+    for char in set(word):
+        mask |= 1 << ord(char)
+    return mask
+
+def _vector_mask(table, words):
+    """_char_mask for many words at once as uint64, with characters bucketed by table"""
+    import numpy as np
+    
+    codes = np.array(words, dtype=str).view(np.uint32).reshape(len(words), -1)
+    return np.bitwise_or.reduce(table[np.minimum(codes, 128)], axis=1)
+
+def edit_distance(a, b, limit):
+    """Optimal string alignment distance (a swap counts as one edit), or limit + 1 once it exceeds limit"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        # A swap reaches back two rows, so stop only when both are past the limit
+        if min(current) > limit and min(previous) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+# Symmetric-delete index: a typo and its correction share a string reachable by deletes alone
+class DomainSuggester:
+    def __init__(self, domains=POPULAR_DOMAINS, max_distance=SUGGESTION_MAX_DISTANCE,
+                 known_domains=KNOWN_DOMAINS + REGIONAL_DOMAINS, cache_size=SUGGESTION_CACHE_SIZE):
+        self.max_distance = max_distance
+        self.known_domains = frozenset(d.lower() for d in known_domains)
+        self.cache_size = cache_size
+        self.rank = {}
+        self._deletes = {}
+        self._masks_by_length = {}
+        for domain in domains:
+            domain = domain.lower()
+            if domain in self.rank:
+                continue
+            self.rank[domain] = len(self.rank)
+            self._masks_by_length.setdefault(len(domain), set()).add(_char_mask(domain))
+            for variant in _deletes(domain, max_distance):
+                self._deletes.setdefault(variant, []).append(domain)
+        self._memo = OrderedDict()
+        self._lock = threading.Lock()
+        self._vector_masks = None
+    
+    def __len__(self):
+        return len(self.rank)
+    
+    def _near_any(self, domain, limit):
+        """False when no popular domain can be within limit edits (cheap length and character check)"""
+        mask = _char_mask(domain)
+        for length in range(len(domain) - limit, len(domain) + limit + 1):
+            for other in self._masks_by_length.get(length, ()):
+                # Every edit adds or removes at most one distinct character on each side
+                if bin(mask & ~other).count('1') <= limit and bin(other & ~mask).count('1') <= limit:
+                    return True
+        return False
+    
+    def _near_many(self, words):
+        """Vectorized _near_any over a list of normalized domains (requires numpy)"""
+        import numpy as np
+        
+        if self._vector_masks is None:
+            table = np.full(129, 1 << len(_MASK_ALPHABET), dtype=np.uint64)
+            table[0] = 0
+            for bit, char in enumerate(_MASK_ALPHABET):
+                table[ord(char)] = 1 << bit
+            self._vector_masks = (table, [(len(d), _vector_mask(table, [d])[0]) for d in self.rank])
+        table, popular = self._vector_masks
+        masks = _vector_mask(table, words)
+        lengths = np.fromiter(map(len, words), dtype=np.int64, count=len(words))
+        
+        def at_most(bits, limit):
+            # Clear the lowest set bit limit times; what is left is zero when at most limit were set
+            for _ in range(limit):
+                bits = bits & (bits - np.uint64(1))
+            return bits == 0
+        
+        # Domains of one length share a limit, so each is compared only with popular domains in reach
+        near = np.zeros(len(words), dtype=bool)
+        for length in np.unique(lengths).tolist():
+            limit = self.max_distance if length >= LONG_DOMAIN_LENGTH else min(self.max_distance, 1)
+            rows = np.flatnonzero(lengths == length)
+            row_masks = masks[rows]
+            hit = np.zeros(len(rows), dtype=bool)
+            for other_length, other in popular:
+                if abs(other_length - length) <= limit:
+                    hit |= at_most(row_masks & ~other, limit) & at_most(other & ~row_masks, limit)
+            near[rows] = hit
+        return near
+    
+    def _search(self, domain):
+        limit = self.max_distance if len(domain) >= LONG_DOMAIN_LENGTH else min(self.max_distance, 1)
+        if not self._near_any(domain, limit):
+            return None
+        name = domain.split('.', 1)[0]
+        best = None
+        for variant in _deletes(domain, limit):
+            for candidate in self._deletes.get(variant, ()):
+                candidate_name = candidate.split('.', 1)[0]
+                # Same name under a suffix not in REGIONAL_DOMAINS is a mistyped suffix
+                if candidate_name != name and len(candidate_name) < SHORT_NAME_LENGTH:
+                    continue
+                distance = edit_distance(domain, candidate, limit)
+                if distance <= limit and (best is None or (distance, self.rank[candidate]) < best[0]):
+                    best = ((distance, self.rank[candidate]), candidate)
+        return best[1] if best else None
+    
+    def suggest(self, domain):
+        """Popular domain that domain looks like a typo of, or None"""
+        domain = domain.strip().lower().rstrip('.')
+        if domain in self.rank or domain in self.known_domains:
+            return None
+        with self._lock:
+            if domain in self._memo:
+                self._memo.move_to_end(domain)
+                return self._memo[domain]
+        suggestion = self._search(domain)
+        with self._lock:
+            self._memo[domain] = suggestion
+            while len(self._memo) > self.cache_size:
+                self._memo.popitem(last=False)
+        return suggestion
+    
+    def suggest_many(self, domains):
+        """{domain: suggestion} for the domains that look like typos, prefiltered in bulk (requires pandas)"""
+        import pandas as pd
+        import pyarrow as pa
+        
+        domains = pd.Series(list(domains), dtype=pd.ArrowDtype(pa.string()))
+        # Same normalization as suggest(), then only lengths a popular domain can reach
+        words = domains.str.strip().str.lower().str.rstrip('.')
+        lengths = words.str.len()
+        shortest = min(self._masks_by_length, default=0) - self.max_distance
+        longest = max(self._masks_by_length, default=0) + self.max_distance
+        reachable = lengths.between(shortest, longest).to_numpy(dtype=bool)
+        if not reachable.any():
+            return {}
+        near = self._near_many(words[reachable].to_numpy().tolist())
+        found = {}
+        for domain, word in zip(domains[reachable][near].tolist(), words[reachable][near].tolist()):
+            suggestion = self.suggest(word)
+            if suggestion:
+                found[domain] = suggestion
+        return found
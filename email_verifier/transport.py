@@ -0,0 +1,109 @@
+"""Pooled HTTP transport for the provider APIs"""
+import os
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .metrics import METRICS
+
+# Provider API hosts; override per provider to point at a local stub server
+PROVIDER_BASE_URLS = {
+    'hunter': os.environ.get('HUNTER_API_URL', 'https://api.hunter.io'),
+    'neverbounce': os.environ.get('NEVERBOUNCE_API_URL', 'https://api.neverbounce.com'),
+    'zerobounce': os.environ.get('ZEROBOUNCE_API_URL', 'https://api.zerobounce.net'),
+    'zerobounce_bulk': os.environ.get('ZEROBOUNCE_BULK_API_URL', 'https://bulkapi.zerobounce.net')
+}
+
+# HTTP transport defaults
+HTTP_POOL_SIZE = 10
+HTTP_CONNECT_TIMEOUT = 3.05
+HTTP_READ_TIMEOUT = 10
+HTTP_MAX_RETRIES = 3
+HTTP_BACKOFF_BASE = 0.5
+HTTP_BACKOFF_MAX = 30
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+# Retry settings and backoff shared by the sync and async transports
+class RetryPolicy:
+    def __init__(self, base_url, connect_timeout=HTTP_CONNECT_TIMEOUT, read_timeout=HTTP_READ_TIMEOUT,
+                 max_retries=HTTP_MAX_RETRIES, backoff_base=HTTP_BACKOFF_BASE, backoff_max=HTTP_BACKOFF_MAX,
+                 name=None):
+        self.base_url = base_url.rstrip('/')
+        # Label for retry metrics; defaults to the host
+        self.name = name or self.base_url.split('//')[-1]
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+    
+    def _retry_delay(self, attempt, response=None, reason='connection'):
+        """Count a retry and return the seconds to wait: Retry-After if given, else jittered backoff"""
+        METRICS.inc('provider_retries_total', provider=self.name, reason=reason)
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                except (TypeError, ValueError):
+                    delay = None
+            if delay is not None:
+                return min(max(delay, 0), self.backoff_max)
+        # Full jitter keeps parallel workers from retrying in lockstep
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+    
+    @staticmethod
+    def decode(response):
+        """Return (status_code, decoded body); the body is {} when it is not JSON"""
+        try:
+            data = response.json()
+        except ValueError:
+            data = {}
+        return response.status_code, data if isinstance(data, dict) else {}
+
+# Pooled keep-alive session for one provider with retry and backoff
+class ProviderTransport(RetryPolicy):
+    def __init__(self, base_url, pool_size=HTTP_POOL_SIZE, sleep=time.sleep, **retry_options):
+        super().__init__(base_url, **retry_options)
+        self.timeout = (self.connect_timeout, self.read_timeout)
+        self.sleep = sleep
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+    
+    def request(self, method, path, retry_statuses=RETRYABLE_STATUSES, **kwargs):
+        """Send a request to base_url + path, retrying connection errors and retry_statuses"""
+        url = self.base_url + path
+        kwargs.setdefault('timeout', self.timeout)
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == self.max_retries:
+                    raise
+                self.sleep(self._retry_delay(attempt))
+                continue
+            if response.status_code not in retry_statuses or attempt == self.max_retries:
+                return response
+            self.sleep(self._retry_delay(attempt, response, str(response.status_code)))
+            response.close()
+    
+    def get(self, path, params=None, **kwargs):
+        return self.request('GET', path, params=params, **kwargs)
+    
+    def get_json(self, path, params=None):
+        return self.decode(self.get(path, params))
+    
+    def close(self):
+        self.session.close()
+
+def build_transports(base_urls=None, **options):
+    """Create one ProviderTransport per provider"""
+    urls = dict(PROVIDER_BASE_URLS, **(base_urls or {}))
+    return {provider: ProviderTransport(url, name=provider, **options) for provider, url in urls.items()}
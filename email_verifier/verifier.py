@@ -0,0 +1,378 @@
+"""Email verification engine: basic checks plus Hunter.io, NeverBounce and ZeroBounce"""
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeout
+
+from .bulk_jobs import BULK_JOB_CLIENTS, BULK_JOB_TIMEOUT
+from .disposable import DISPOSABLE_DOMAIN_LISTS, DisposableDomainIndex
+from .limits import build_rate_limiters
+from .metrics import METRICS, record_cache_lookup, record_provider_call
+from .providers import PROVIDER_CLIENTS
+from .results import normalize_email
+from .scoring import CONSENSUS_THRESHOLD, provider_order, score_results
+from .suggest import DomainSuggester
+
+# Address format accepted by the basic check
+EMAIL_PATTERN = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+EMAIL_REGEX = re.compile(EMAIL_PATTERN)
+
+# basic_status labels for an invalid, a valid and a disposable address
+BASIC_STATUSES = ('Invalid Format', 'Valid (Basic Check)', 'Disposable Email')
+
+# Overall time budget (seconds) for one fan-out across all providers
+PROVIDER_DEADLINE = 12
+
+# Professional verification services class
+class ProEmailVerifier:
+    def __init__(self, cache=None, store=None, transports=None, rate_limiters=None, ledger=None):
+        self.disposable_domains = self._load_disposable_domains()
+        self.domain_suggester = DomainSuggester()
+        self.cache = cache
+        self.store = store
+        self._transports = transports
+        self.rate_limiters = rate_limiters or build_rate_limiters()
+        self.ledger = ledger
+        self.api_status = {
+            'hunter': False,
+            'neverbounce': False,
+            'zerobounce': False
+        }
+    
+    @property
+    def transports(self):
+        """Provider HTTP transports, created on first use so basic-only runs skip requests"""
+        if self._transports is None:
+            from .transport import build_transports
+            self._transports = build_transports()
+        return self._transports
+    
+    def _load_disposable_domains(self):
+        """Built-in disposable domains plus any external blocklists"""
+        builtin = {
+            'tempmail.com', 'mailinator.com', '10minutemail.com',
+            'throwawaymail.com', 'yopmail.com', 'guerrillamail.com',
+            'temp-mail.org', 'fakeinbox.com', 'dispostable.com',
+            'getairmail.com', 'maildrop.cc', 'tempail.com',
+            'sharklasers.com', 'guerrillamail.net', 'yopmail.net',
+            'mailinator.net', 'trashmail.com', 'mailcatch.com'
+        }
+        return DisposableDomainIndex(builtin, DISPOSABLE_DOMAIN_LISTS)
+    
+    # Basic verification (always works)
+    def basic_verify(self, email):
+        """Basic email verification"""
+        result = {
+            'email': email,
+            'basic_format': False,
+            'basic_disposable': False,
+            'basic_status': 'Unknown',
+            'basic_suggestion': '',
+            'professional_checks': {}
+        }
+        
+        # Format check
+        if not EMAIL_REGEX.match(email):
+            result['basic_status'] = 'Invalid Format'
+            return result
+        
+        result['basic_format'] = True
+        
+        # Domain check
+        domain = email.split('@')[1].lower()
+        
+        # Disposable check
+        if domain in self.disposable_domains:
+            result['basic_disposable'] = True
+            result['basic_status'] = 'Disposable Email'
+            return result
+        
+        # Typo check: a near miss of a popular provider domain gets a suggested correction;
+        # the address stays valid so providers can still confirm it
+        suggestion = self.domain_suggester.suggest(domain)
+        if suggestion:
+            result['basic_suggestion'] = f"{email.split('@')[0]}@{suggestion}"
+        
+        result['basic_status'] = 'Valid (Basic Check)'
+        return result
+    
+    # Vectorized basic verification for lists
+    def basic_verify_many(self, emails):
+        """Run basic_verify over a pandas Series using column operations
+        
+        Returns a DataFrame with one row per input (same index) and the same
+        email/basic_* values that basic_verify would produce for each address.
+        Disposable and typo lookups run once per distinct domain.
+        """
+        import numpy as np
+        import pandas as pd
+        import pyarrow as pa
+        
+        emails = pd.Series(emails)
+        # Arrow-backed strings keep the string kernels in pyarrow and let split return list columns
+        text = emails.astype(str).where(emails.notna(), '').astype(pd.ArrowDtype(pa.string()))
+        
+        # re.match lets '$' match before one trailing newline; pyarrow's engine does not, so allow it
+        is_format = text.str.match(EMAIL_PATTERN.removesuffix('$') + r'\n?$').astype(bool)
+        # Rows with a valid format contain exactly one '@', so only those are split
+        parts = text[is_format].str.split('@', n=1)
+        # Lookups run once per distinct domain, then map back to the rows by factor code
+        codes, distinct = pd.factorize(parts.list[1])
+        distinct = pd.Series(distinct).str.lower().to_numpy()
+        distinct_disposable = np.fromiter(map(self.disposable_domains.__contains__, distinct),
+                                          dtype=bool, count=len(distinct))
+        disposable = distinct_disposable[codes]
+        is_disposable = is_format.copy()
+        is_disposable[is_format] = disposable
+        suggested = self.domain_suggester.suggest_many(distinct[~distinct_disposable].tolist())
+        suggestion = pd.Series('', index=emails.index)
+        if suggested:
+            corrected = np.array([suggested.get(d, '') for d in distinct], dtype=object)[codes]
+            typo = corrected != ''
+            is_typo = is_format.copy()
+            is_typo[is_format] = typo
+            suggestion[is_typo] = parts.list[0][typo].to_numpy(dtype=object) + '@' + corrected[typo]
+        
+        # Disposable rows are a subset of the valid ones, so the two flags add up to a label index
+        labels = is_format.to_numpy(dtype='int8') + is_disposable.to_numpy(dtype='int8')
+        status = pd.Series(pd.array(pa.array(BASIC_STATUSES).take(labels), dtype='str'), index=emails.index)
+        
+        return pd.DataFrame({
+            'email': emails,
+            'basic_format': is_format,
+            'basic_disposable': is_disposable,
+            'basic_status': status,
+            'basic_suggestion': suggestion
+        })
+    
+    def _cached_result(self, provider, email, count=False):
+        """Result from the memory cache or the persistent store, or None
+        
+        count records the lookup in the cache hit-ratio metrics; cost-ordering
+        peeks leave it off.
+        """
+        cached = self._memory_result(provider, email, count)
+        if cached is None:
+            cached = self._stored_result(provider, email, count)
+        return cached
+    
+    def _memory_result(self, provider, email, count=False):
+        if self.cache is None:
+            return None
+        cached = self.cache.get(provider, email)
+        if count:
+            record_cache_lookup(provider, 'memory', cached is not None)
+        return cached
+    
+    def _stored_result(self, provider, email, count=False):
+        """Result from the persistent store (blocking SQLite read), copied into the memory cache"""
+        if self.store is None:
+            return None
+        stored = self.store.get(provider, email)
+        if count:
+            record_cache_lookup(provider, 'store', stored is not None)
+        if stored is not None and self.cache is not None:
+            self.cache.put(provider, email, stored)
+        return stored
+    
+    def _record_result(self, provider, email, result, api_key=None, store=True):
+        """Settle the reserved credit and cache a fresh provider result
+        
+        store=False leaves the persistent store to the caller (async sessions
+        write it off the event loop).
+        """
+        if self.ledger is not None:
+            if 'error' in result:
+                self.ledger.refund(provider, api_key)
+            else:
+                self.ledger.update_from_result(provider, result, api_key)
+        
+        # Errors are not cached so a transient failure can be retried
+        if 'error' not in result:
+            if self.cache is not None:
+                self.cache.put(provider, email, result)
+            if store and self.store is not None:
+                self.store.put(provider, email, result)
+    
+    def _cached_call(self, provider, email, api_key):
+        """Run a provider request at most once per email per cache TTL"""
+        if not api_key:
+            return {'error': 'API key not configured'}
+        
+        cached = self._cached_result(provider, email, count=True)
+        if cached is not None:
+            return cached
+        
+        if self.ledger is not None and not self.ledger.reserve(provider, api_key):
+            return {'error': 'Credit budget exhausted', 'budget_exhausted': True}
+        if provider in self.rate_limiters:
+            self.rate_limiters[provider].acquire()
+        
+        started = time.perf_counter()
+        result = PROVIDER_CLIENTS[provider].verify(self.transports[provider], email, api_key)
+        record_provider_call(provider, result, time.perf_counter() - started)
+        self._record_result(provider, email, result, api_key)
+        return result
+    
+    def run_bulk_job(self, provider, emails, api_key, timeout=BULK_JOB_TIMEOUT, on_progress=None):
+        """Verify a list through the provider's bulk job API
+        
+        Returns {normalized email: result} in the same schema as the single-check
+        method and stores the results in the persistent cache.
+        """
+        job_class, transport_name = BULK_JOB_CLIENTS[provider]
+        job = job_class(self.transports[transport_name], api_key)
+        results = {}
+        for email, result in job.run(emails, timeout=timeout, on_progress=on_progress):
+            results[normalize_email(email)] = result
+        if self.ledger is not None:
+            self.ledger.charge(provider, len(emails), api_key)
+        if self.store is not None and results:
+            self.store.put_many(provider, results)
+        return results
+    
+    def lookup_many(self, emails, providers):
+        """Fetch stored results for many addresses: {provider: {normalized email: result}}"""
+        if self.store is None:
+            return {provider: {} for provider in providers}
+        stored = {provider: self.store.get_many(provider, emails) for provider in providers}
+        for provider, found in stored.items():
+            METRICS.inc('cache_lookups_total', len(found), provider=provider, tier='store_batch', outcome='hit')
+            METRICS.inc('cache_lookups_total', len(emails) - len(found), provider=provider, tier='store_batch', outcome='miss')
+        return stored
+    
+    # Single checks; request and response mapping live in providers.py
+    def hunter_verify(self, email, api_key):
+        """Verify email using Hunter.io API"""
+        return self._cached_call('hunter', email, api_key)
+    
+    def neverbounce_verify(self, email, api_key):
+        """Verify email using NeverBounce API"""
+        return self._cached_call('neverbounce', email, api_key)
+    
+    def zerobounce_verify(self, email, api_key):
+        """Verify email using ZeroBounce API"""
+        return self._cached_call('zerobounce', email, api_key)
+    
+    def async_session(self, **options):
+        """AsyncVerifierSession for this verifier; create it inside the event loop that uses it"""
+        from .async_clients import AsyncVerifierSession
+        return AsyncVerifierSession(self, **options)
+    
+    def verify_many(self, emails, api_keys, **options):
+        """Check many addresses on one event loop: {email: {provider: result}}
+        
+        Sync entry point for callers without a running loop; options go to
+        async_session (concurrency, provider_concurrency).
+        """
+        import asyncio
+        
+        async def run():
+            async with self.async_session(**options) as session:
+                return await session.verify_many(emails, api_keys)
+        return asyncio.run(run())
+    
+    # Concurrent verification across all configured providers
+    def iter_verify_all(self, email, api_keys, deadline=PROVIDER_DEADLINE):
+        """Yield (provider, result) pairs as each provider finishes
+        
+        Providers still running when the deadline passes are yielded with a
+        timed-out error result instead of blocking the caller.
+        """
+        calls = {
+            'hunter': self.hunter_verify,
+            'neverbounce': self.neverbounce_verify,
+            'zerobounce': self.zerobounce_verify
+        }
+        configured = [p for p in calls if api_keys.get(p)]
+        if not configured:
+            return
+        
+        executor = ThreadPoolExecutor(max_workers=len(configured))
+        futures = {
+            executor.submit(calls[provider], email, api_keys[provider]): provider
+            for provider in configured
+        }
+        pending = set(configured)
+        try:
+            for future in as_completed(futures, timeout=deadline):
+                provider = futures[future]
+                pending.discard(provider)
+                yield provider, future.result()
+        except FuturesTimeout:
+            for provider in configured:
+                if provider in pending:
+                    METRICS.inc('provider_deadline_total', provider=provider)
+                    yield provider, {'error': f'Timed out after {deadline}s', 'timed_out': True}
+        finally:
+            # Late responses still land in the cache; nobody waits for them here
+            executor.shutdown(wait=False)
+    
+    def verify_all(self, email, api_keys, deadline=PROVIDER_DEADLINE):
+        """Verify with every configured provider concurrently within a deadline"""
+        return dict(self.iter_verify_all(email, api_keys, deadline))
+    
+    # Cost-ordered verification that stops once the verdict is settled
+    def iter_verify_consensus(self, email, api_keys, basic_result=None, threshold=CONSENSUS_THRESHOLD):
+        """Yield (provider, result) cheapest first until the consensus reaches threshold
+        
+        Cached answers are used before any paid call. Providers left over once
+        the verdict is confident enough are never called.
+        """
+        basic_result = basic_result or self.basic_verify(email)
+        configured = [p for p in PROVIDER_CLIENTS if api_keys.get(p)]
+        results = {}
+        for provider in provider_order(configured, lambda p: self._cached_result(p, email) is not None):
+            if score_results(basic_result, results)['confidence'] >= threshold:
+                return
+            results[provider] = self._cached_call(provider, email, api_keys[provider])
+            yield provider, results[provider]
+    
+    def verify_consensus(self, email, api_keys, basic_result=None, threshold=CONSENSUS_THRESHOLD):
+        """Return (consensus verdict, provider results) for one address"""
+        basic_result = basic_result or self.basic_verify(email)
+        results = dict(self.iter_verify_consensus(email, api_keys, basic_result, threshold))
+        return score_results(basic_result, results), results
+    
+    # API key probe (account endpoints do not spend verification credits)
+    def _probe_api_key(self, provider, api_key):
+        if not api_key:
+            return {'error': 'API key not configured'}
+        
+        try:
+            if provider == 'hunter':
+                status_code, data = self.transports['hunter'].get_json('/v2/account', {'api_key': api_key})
+                if status_code != 200:
+                    return {'error': data.get('errors', [{}])[0].get('details', 'API error')}
+                calls = data.get('data', {}).get('requests', {}).get('verifications')
+                if not calls:
+                    return {}
+                return {'credits': calls.get('available', 0) - calls.get('used', 0)}
+            
+            if provider == 'neverbounce':
+                status_code, data = self.transports['neverbounce'].get_json('/v4/account/info', {'key': api_key})
+                if status_code != 200 or data.get('status') != 'success':
+                    return {'error': data.get('message', 'API error')}
+                credits = data.get('credits_info')
+                if not credits:
+                    return {}
+                return {'credits': credits.get('free_credits_remaining', 0) + credits.get('paid_credits_remaining', 0)}
+            
+            if provider == 'zerobounce':
+                status_code, data = self.transports['zerobounce'].get_json('/v2/getcredits', {'api_key': api_key})
+                credits = int(data.get('Credits', -1))
+                if status_code != 200 or credits < 0:
+                    return {'error': data.get('error', 'Invalid API key')}
+                return {'credits': credits}
+            
+            return {'error': f'Unknown provider: {provider}'}
+        
+        except Exception as e:
+            return {'error': str(e)}
+    
+    def check_api_key(self, provider, api_key):
+        """Check that an API key is accepted by the provider"""
+        with METRICS.timer('key_check_seconds', provider=provider):
+            result = self._probe_api_key(provider, api_key)
+        if self.ledger is not None and 'credits' in result:
+            self.ledger.set_remaining(provider, result['credits'], api_key)
+        return result